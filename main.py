@@ -13,7 +13,6 @@ Environment variables:
   WEBHOOK_SECRET     – Secret token to verify webhook requests (optional)
 """
 
-import json
 import os
 import re
 import sys
@@ -21,18 +20,44 @@ import html
 import logging
 import hashlib
 import tempfile
+import xml.etree.ElementTree as ET
+import functools
+import time
+import threading
+import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import quote, urlsplit
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, request as flask_request, jsonify
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from dotenv import load_dotenv
 import gspread
 from google.oauth2.service_account import Credentials
-import feedparser
 import google.generativeai as genai
 
+# Optional extras for the rich /news modes; each mode reports when its
+# package is missing instead of failing at import.
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+try:
+    from gtts import gTTS
+except ImportError:
+    gTTS = None
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = ImageDraw = ImageFont = None
+
 # Load .env file (for local testing; ignored in GitHub Actions)
 load_dotenv()
 
@@ -61,6 +86,9 @@ def now_ist() -> datetime:
     return datetime.now(IST)
 
 
+# Telegram Bot API requests carry pre-serialized (orjson) bodies
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -79,6 +107,78 @@ SCOPES = [
 ]
 
 
+def build_http_session() -> requests.Session:
+    """
+    Create a pooled keep-alive session that retries transient 5xx errors.
+    Browser-like HEADERS are session defaults, so each request reuses them.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class CappedRetry(Retry):
+    """Retry policy that never sleeps longer than max_retry_after for Retry-After."""
+
+    max_retry_after = 5  # seconds
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.max_retry_after)
+
+
+def build_telegram_session() -> requests.Session:
+    """
+    Keep-alive session for api.telegram.org. Every call is retried on
+    connection failures (nothing was sent) and once on 429 (Telegram rejected
+    it), waiting at most a few seconds. Idempotent calls (getUpdates,
+    setMyCommands, ...) also get one retry after a read error such as a
+    stale keep-alive reset. send* calls don't: a timed-out or 5xx send may
+    already have been delivered, and resending would duplicate the message.
+    """
+    def adapter(read_retries: int, pool_maxsize: int) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            max_retries=CappedRetry(total=2, connect=2, read=read_retries, status=1,
+                                    backoff_factor=0.3, status_forcelist=[429],
+                                    allowed_methods=None, raise_on_status=False),
+        )
+
+    session = requests.Session()
+    session.mount("https://", adapter(read_retries=1, pool_maxsize=4))
+    # Longest prefix wins: sendMessage, sendPhoto and sendVoice
+    session.mount(f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/send",
+                  adapter(read_retries=0, pool_maxsize=16))
+    return session
+
+
+# Shared across scraping and feed calls so TLS connections are reused
+_SESSION = build_http_session()
+# Product pages: fail fast on an unreachable host, allow a slow first byte
+SCRAPE_TIMEOUT = (5, 20)  # (connect, read) seconds
+_TG_SESSION = build_telegram_session()
+TG_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# Gemini is configured once per process; news features are off without a key
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+_GEMINI_MODEL = genai.GenerativeModel("gemini-2.0-flash") if GEMINI_API_KEY else None
+
+# Hard output caps, sized with headroom over each prompt's word limit, so
+# Gemini stops early instead of running long
+GEN_CFG_SHORT = genai.types.GenerationConfig(max_output_tokens=300, temperature=0.7)
+GEN_CFG_LONG = genai.types.GenerationConfig(max_output_tokens=600, temperature=0.6)
+
+
 # ──────────────────────────── Validation ─────────────────────────
 def validate_config() -> None:
     """Ensure all required env vars are set."""
@@ -97,7 +197,7 @@ def validate_config() -> None:
 # ──────────────────────────── Google Sheets ──────────────────────
 def connect_to_sheet() -> gspread.Spreadsheet:
     """Authenticate with Google and return the spreadsheet."""
-    creds_dict = json.loads(GOOGLE_CREDENTIALS)
+    creds_dict = orjson.loads(GOOGLE_CREDENTIALS)
     creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
     client = gspread.authorize(creds)
     sheet = client.open_by_key(SHEET_ID)
@@ -105,8 +205,67 @@ def connect_to_sheet() -> gspread.Spreadsheet:
     return sheet
 
 
+# Process-wide spreadsheet + worksheet handles, so webhook requests skip the
+# auth and metadata round-trips. Re-opened after the TTL or on invalidation.
+SHEET_HANDLE_TTL = 300  # seconds
+_sheet_handles: dict[str, Any] = {}
+_sheet_handles_at = 0.0
+_sheet_handles_lock = threading.RLock()
+
+
+def _get_sheet() -> gspread.Spreadsheet:
+    """Return the cached Spreadsheet handle, reconnecting when it expires."""
+    global _sheet_handles_at
+    with _sheet_handles_lock:
+        if ("sheet" not in _sheet_handles
+                or time.monotonic() - _sheet_handles_at > SHEET_HANDLE_TTL):
+            _sheet_handles.clear()
+            _sheet_handles["sheet"] = connect_to_sheet()
+            _sheet_handles_at = time.monotonic()
+        return _sheet_handles["sheet"]
+
+
+def _cached_worksheet(
+    name: str,
+    opener: Callable[[gspread.Spreadsheet], gspread.Worksheet],
+) -> gspread.Worksheet:
+    """Return a cached worksheet handle, opening it with opener() if needed."""
+    with _sheet_handles_lock:
+        sheet = _get_sheet()
+        if name not in _sheet_handles:
+            _sheet_handles[name] = opener(sheet)
+        return _sheet_handles[name]
+
+
+def invalidate_sheet_handles() -> None:
+    """Forget cached handles (e.g. after an auth or API error)."""
+    with _sheet_handles_lock:
+        _sheet_handles.clear()
+
+
+def get_cached_sheets() -> tuple[gspread.Worksheet, gspread.Worksheet]:
+    """Return the cached (Products, Price_History) worksheet handles."""
+    return (_cached_worksheet("Products", get_products_worksheet),
+            _cached_worksheet("Price_History", get_history_worksheet))
+
+
+def _get_products_ws() -> gspread.Worksheet:
+    """Cached 'Products' worksheet handle."""
+    return _cached_worksheet("Products", get_products_worksheet)
+
+
+def _get_news_history_ws() -> gspread.Worksheet:
+    """Cached 'News_History' worksheet handle."""
+    return _cached_worksheet("News_History", get_news_history_worksheet)
+
+
+# "<spreadsheet id>:<tab>" keys whose header migration already ran in this process
+_MIGRATED_WORKSHEETS: set[str] = set()
+
+
 def get_products_worksheet(sheet: gspread.Spreadsheet) -> gspread.Worksheet:
     """Get or create the 'Products' tab with 6 columns."""
+    migrated_key = f"{sheet.id}:Products"
     try:
         ws = sheet.worksheet("Products")
     except gspread.WorksheetNotFound:
@@ -114,14 +273,17 @@ def get_products_worksheet(sheet: gspread.Spreadsheet) -> gspread.Worksheet:
         ws.update("A1:F1", [["Name", "URL", "Target_Price", "Current_Price",
                               "Last_Alerted", "Status"]])
         log.info("Created 'Products' tab with headers.")
+        _MIGRATED_WORKSHEETS.add(migrated_key)
+        return ws
+
+    if migrated_key in _MIGRATED_WORKSHEETS:
         return ws
 
     # Auto-migrate: add missing columns E, F if sheet was created before
     headers = ws.row_values(1)
-    if len(headers) < 5:
-        ws.update_acell("E1", "Last_Alerted")
     if len(headers) < 6:
-        ws.update_acell("F1", "Status")
+        ws.batch_update([{"range": "E1:F1", "values": [["Last_Alerted", "Status"]]}])
+    _MIGRATED_WORKSHEETS.add(migrated_key)
     return ws
 
 
@@ -147,18 +309,79 @@ def get_history_worksheet(sheet: gspread.Spreadsheet) -> gspread.Worksheet:
     return ws
 
 
+# Rows waiting to be written to Price_History in one batch (see flush_history)
+_pending_history_rows: list[list] = []
+
+# Latest Price_History rows per product name, for /history. Rows we flush are
+# added in place; the TTL picks up rows written by other processes.
+HISTORY_INDEX_TTL = 300  # seconds
+HISTORY_SHOWN = 10       # entries /history displays (and the index keeps)
+_history_index: dict[str, deque[list[str]]] | None = None
+_history_index_loaded_at = 0.0
+
+
+def _history_bucket() -> deque[list[str]]:
+    """Per-product row buffer that keeps only the newest HISTORY_SHOWN rows."""
+    return deque(maxlen=HISTORY_SHOWN)
+
+
+def get_history_index(history_ws: gspread.Worksheet) -> dict[str, deque[list[str]]]:
+    """Return {product name: latest history rows, oldest first}, loading if needed."""
+    global _history_index, _history_index_loaded_at
+    if (_history_index is None
+            or time.monotonic() - _history_index_loaded_at > HISTORY_INDEX_TTL):
+        index: dict[str, deque[list[str]]] = {}
+        # Date, Product, Price only; the Target column is never shown
+        for row in history_ws.get("A2:C"):
+            if len(row) > 1:
+                index.setdefault(row[1], _history_bucket()).append(row)
+        _history_index = index
+        _history_index_loaded_at = time.monotonic()
+    return _history_index
+
+
 def log_price_history(
     history_ws: gspread.Worksheet,
     name: str,
     price: float,
     target: float,
 ) -> None:
-    """Append a row to the Price_History tab."""
+    """Queue a row for the Price_History tab (written by flush_history)."""
     now = now_ist().strftime("%Y-%m-%d %H:%M")
+    _pending_history_rows.append([now, name, f"{price:.2f}", f"{target:.0f}"])
+
+
+def flush_history(history_ws: gspread.Worksheet) -> None:
+    """Append all queued Price_History rows with a single API call."""
+    if not _pending_history_rows:
+        return
+    rows = _pending_history_rows[:]
+    _pending_history_rows.clear()
     try:
-        history_ws.append_row([now, name, f"{price:.2f}", f"{target:.0f}"])
+        history_ws.append_rows(rows)
     except Exception as exc:
         log.warning("Could not log to Price_History: %s", exc)
+        return
+    if _history_index is not None:
+        for row in rows:
+            _history_index.setdefault(row[1], _history_bucket()).append(row)
+
+
+def read_startup_values(
+    sheet: gspread.Spreadsheet,
+    settings_ws: gspread.Worksheet,
+    products_ws: gspread.Worksheet,
+) -> int:
+    """
+    Read Settings!A1 and the whole Products tab in one Sheets call.
+    Seeds the Products snapshot and returns the last processed update ID.
+    """
+    resp = sheet.values_batch_get([f"'{settings_ws.title}'!A1",
+                                   f"'{products_ws.title}'!A:F"])
+    settings_vals, product_vals = (r.get("values", []) for r in resp["valueRanges"])
+    prime_product_rows(product_vals)
+    val = settings_vals[0][0] if settings_vals and settings_vals[0] else ""
+    return int(val) if val.isdigit() else 0
 
 
 def get_last_update_id(settings_ws: gspread.Worksheet) -> int:
@@ -173,71 +396,195 @@ def set_last_update_id(settings_ws: gspread.Worksheet, update_id: int) -> None:
 
 
 # ──────────────────────────── Price Helpers ──────────────────────
+_PRICE_RE = re.compile(r"[\d]+\.?\d*")
+# ₹ followed by a price — e.g. ₹1,199 or ₹55,999.00
+_RUPEE_RE = re.compile(r"₹\s*([\d,]+(?:\.\d{1,2})?)")
+# ₹ amounts below this are fees/add-ons (e.g. ₹19 protect fee), not product prices
+MIN_PLAUSIBLE_PRICE = 50
+
+
 def extract_price(text: str) -> float | None:
     """Pull the first price-like number from a string."""
     cleaned = text.replace(",", "").strip()
-    match = re.search(r"[\d]+\.?\d*", cleaned)
+    match = _PRICE_RE.search(cleaned)
     return float(match.group()) if match else None
 
 
+# One scan for every supported store name, including app share short links
+# (amzn.in / amzn.to, fkrt.it); group 1 is Amazon, group 2 Flipkart
+_PLATFORM_RE = re.compile(r"(amazon|amzn\.)|(flipkart|fkrt\.|flpkt\.)", re.IGNORECASE)
+
+
 def detect_platform(url: str) -> str:
     """Return 'amazon' or 'flipkart' based on URL, or 'unknown'."""
-    lower = url.lower()
-    if "amazon" in lower:
-        return "amazon"
-    if "flipkart" in lower:
-        return "flipkart"
-    return "unknown"
+    match = _PLATFORM_RE.search(url)
+    if match is None:
+        return "unknown"
+    return "amazon" if match.group(1) else "flipkart"
 
 
 # ──────────────────────────── Scraping ───────────────────────────
-def fetch_page(url: str) -> BeautifulSoup | None:
-    """Fetch a URL and return a BeautifulSoup object."""
+def parse_html(html_text: str) -> lxml_html.HtmlElement | None:
+    """Parse page text into an lxml document, or None if there's nothing to parse."""
+    # lxml rejects str input that carries an XML encoding declaration
+    if html_text.lstrip().startswith("<?xml"):
+        html_text = html_text.split("?>", 1)[-1]
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        return lxml_html.document_fromstring(html_text)
+    except etree.ParserError:
+        return None
+
+
+def fetch_page(url: str) -> lxml_html.HtmlElement | None:
+    """Fetch a URL and return the parsed lxml document."""
+    try:
+        resp = _SESSION.get(url, timeout=SCRAPE_TIMEOUT)
         resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
+        return parse_html(resp.text)
     except requests.RequestException as exc:
         log.error("HTTP request failed for %s: %s", url, exc)
         return None
 
 
+def css_to_xpath(css: str) -> str:
+    """
+    Translate the simple selectors used below (tag, #id, .class, descendant
+    combinator) to XPath, so lxml can run them without cssselect.
+    """
+    steps = []
+    for part in css.split():
+        tag, ident, classes = re.fullmatch(r"(\w*)(#[\w-]+)?((?:\.[\w-]+)*)", part).groups()
+        conds = [f'@id="{ident[1:]}"'] if ident else []
+        conds += [f'contains(concat(" ", normalize-space(@class), " "), " {c} ")'
+                  for c in classes.split(".")[1:]]
+        steps.append((tag or "*") + "".join(f"[{c}]" for c in conds))
+    return "//" + "//".join(steps)
+
+
+# Platform-specific CSS selectors, most specific first, with their XPath
+def _selectors(css_list: list[str]) -> list[tuple[str, str]]:
+    return [(css, css_to_xpath(css)) for css in css_list]
+
+
+TITLE_SELECTORS = {
+    "amazon": _selectors(["span#productTitle"]),
+    "flipkart": _selectors(["span.VU-ZEz", "h1.yhB1nd", "span.B_NuCI", "h1._9E25nV"]),
+}
+PRICE_SELECTORS = {
+    "amazon": _selectors(["span.a-price-whole", "span#priceblock_dealprice",
+                          "span#priceblock_ourprice", "span.a-offscreen",
+                          "div#corePrice_feature_div span.a-price-whole",
+                          "span.priceToPay span.a-price-whole"]),
+    "flipkart": _selectors(["div.Nx9bqj.CxhGGd", "div._30jeq3._16Jk6d",
+                            "div._30jeq3", "div.Nx9bqj"]),
+}
+
+
+def _first_text(doc: lxml_html.HtmlElement, xpath: str) -> str | None:
+    """Text content of the first element matching xpath, or None."""
+    found = doc.xpath(xpath)
+    return found[0].text_content() if found else None
+
+
+def _meta_content(doc: lxml_html.HtmlElement, prop: str) -> str | None:
+    """content= of the first <meta property=prop>, or None."""
+    found = doc.xpath(f'//meta[@property="{prop}"]/@content')
+    return found[0] if found else None
+
+
+# ── JSON-LD (shared by title and price extraction) ──
+
+def product_ld_items(raw: str) -> list[dict]:
+    """Parse one JSON-LD block into its dict items ([] if it isn't product data)."""
+    # Cheap substring check skips BreadcrumbList / Organization / WebSite
+    # blocks; only Product-like items are ever used by the extractors
+    if '"Product"' not in raw and '"offers"' not in raw:
+        return []
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return []
+    # Handle both single objects and arrays
+    return [item for item in (data if isinstance(data, list) else [data])
+            if isinstance(item, dict)]
+
+
+def parse_json_ld(doc: lxml_html.HtmlElement) -> list[dict]:
+    """Parse the page's product JSON-LD blocks into a flat list of dict items."""
+    items: list[dict] = []
+    for script in doc.xpath('//script[@type="application/ld+json"]'):
+        items.extend(product_ld_items(script.text or ""))
+    return items
+
+
+# ── Strategy memory ("pointing patterns") ──
+
+# (site_key, "title"|"price") → name of the strategy that last succeeded
+_STRATEGY_CACHE: dict[tuple[str, str], str] = {}
+
+
+def site_key_for(url: str) -> str:
+    """
+    Key pages by host: product pages on one store share a layout, while the
+    first path segment is often a per-product slug (Flipkart's /<slug>/p/…).
+    """
+    return urlsplit(url).netloc.lower()
+
+
+def run_strategies(
+    strategies: list[tuple[str, Callable[[], Any]]],
+    cache_key: tuple[str, str],
+    log_fmt: str,
+) -> Any:
+    """
+    Run extraction strategies in order and return the first truthy result.
+    The strategy that worked last time for this cache key is tried first,
+    so steady-state scrapes usually need a single attempt. The last-resort
+    strategy is never remembered, so better sources get retried next time.
+    """
+    last_resort = strategies[-1][0]
+    remembered = _STRATEGY_CACHE.get(cache_key)
+    if remembered:
+        # Stable sort: remembered strategy first, the rest keep their order
+        strategies = sorted(strategies, key=lambda s: s[0] != remembered)
+
+    for name, extract in strategies:
+        value = extract()
+        if value:
+            log.debug(log_fmt, name)
+            if cache_key[0] and name != last_resort:
+                _STRATEGY_CACHE[cache_key] = name
+            return value
+    return None
+
+
 # ── Title Extraction (multi-strategy) ──
 
-def extract_title_from_json_ld(soup: BeautifulSoup) -> str | None:
+def extract_title_from_json_ld(items: list[dict]) -> str | None:
     """Extract title from JSON-LD structured data (works on both sites)."""
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            data = json.loads(script.string or "")
-            # Handle both single objects and arrays
-            items = data if isinstance(data, list) else [data]
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                # Match by @type OR by having both 'name' and 'offers' keys
-                is_product = (
-                    item.get("@type") == "Product"
-                    or (item.get("name") and item.get("offers"))
-                )
-                if is_product and item.get("name"):
-                    return item["name"].strip()
-        except (json.JSONDecodeError, AttributeError, TypeError):
-            continue
+    for item in items:
+        # Match by @type OR by having both 'name' and 'offers' keys
+        is_product = (
+            item.get("@type") == "Product"
+            or (item.get("name") and item.get("offers"))
+        )
+        name = item.get("name")
+        if is_product and isinstance(name, str):
+            return name.strip()
     return None
 
 
-def extract_title_from_meta(soup: BeautifulSoup) -> str | None:
+def extract_title_from_meta(doc: lxml_html.HtmlElement) -> str | None:
     """Extract title from og:title meta tag."""
-    tag = soup.find("meta", property="og:title")
-    if tag and tag.get("content"):
-        return tag["content"].strip()
-    return None
+    content = _meta_content(doc, "og:title")
+    return content.strip() if content else None
 
 
-def extract_title_from_page(soup: BeautifulSoup) -> str | None:
+def extract_title_from_page(doc: lxml_html.HtmlElement) -> str | None:
     """Extract and clean the <title> tag."""
-    if soup.title and soup.title.string:
-        raw = soup.title.string.strip()
+    raw = doc.findtext(".//title")
+    if raw:
+        raw = raw.strip()
         # Clean common suffixes
         for sep in [" - Buy ", " : Amazon", " | Amazon", " - Amazon",
                     " Price in India", " at Best Price", " Online at"]:
@@ -247,162 +594,210 @@ def extract_title_from_page(soup: BeautifulSoup) -> str | None:
     return None
 
 
-def scrape_title(soup: BeautifulSoup, platform: str) -> str | None:
+def _css_title(doc: lxml_html.HtmlElement, xpath: str) -> str | None:
+    """Return the stripped text of the first element matching a selector."""
+    text = _first_text(doc, xpath)
+    return (text.strip() or None) if text else None
+
+
+def scrape_title(
+    doc: lxml_html.HtmlElement,
+    platform: str,
+    ld_items: list[dict] | None = None,
+    site_key: str = "",
+) -> str | None:
     """Try multiple strategies to get the product title."""
+    if ld_items is None:
+        ld_items = parse_json_ld(doc)
+
     # Strategy 1: JSON-LD structured data (most reliable)
-    title = extract_title_from_json_ld(soup)
-    if title:
-        log.info("   📛 Title from JSON-LD: %s", title[:60])
-        return title
+    strategies = [("JSON-LD", lambda: extract_title_from_json_ld(ld_items))]
 
     # Strategy 2: Platform-specific CSS selectors
-    if platform == "amazon":
-        tag = soup.select_one("span#productTitle")
-        if tag:
-            title = tag.get_text().strip()
-            if title:
-                log.info("   📛 Title from #productTitle")
-                return title
-
-    if platform == "flipkart":
-        for css in ["span.VU-ZEz", "h1.yhB1nd", "span.B_NuCI", "h1._9E25nV"]:
-            tag = soup.select_one(css)
-            if tag:
-                title = tag.get_text().strip()
-                if title:
-                    log.info("   📛 Title from CSS: %s", css)
-                    return title
+    strategies += [(f"CSS: {css}", functools.partial(_css_title, doc, xpath))
+                   for css, xpath in TITLE_SELECTORS.get(platform, [])]
 
     # Strategy 3: og:title meta tag
-    title = extract_title_from_meta(soup)
-    if title:
-        log.info("   📛 Title from og:title")
-        return title
+    strategies.append(("og:title", lambda: extract_title_from_meta(doc)))
 
     # Strategy 4: <title> tag (fallback, always present)
-    title = extract_title_from_page(soup)
-    if title:
-        log.info("   📛 Title from <title> tag")
-        return title
+    strategies.append(("<title> tag", lambda: extract_title_from_page(doc)))
 
-    return None
+    return run_strategies(strategies, (site_key, "title"), "   📛 Title from %s")
 
 
 # ── Price Extraction (multi-strategy) ──
 
-def extract_price_from_json_ld(soup: BeautifulSoup) -> float | None:
+def extract_price_from_json_ld(items: list[dict]) -> float | None:
     """Extract price from JSON-LD structured data."""
-    for script in soup.find_all("script", type="application/ld+json"):
+    for item in items:
+        # Match by @type OR by having 'offers' key
+        is_product = (
+            item.get("@type") == "Product"
+            or item.get("offers")
+        )
+        if not is_product:
+            continue
         try:
-            data = json.loads(script.string or "")
-            items = data if isinstance(data, list) else [data]
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                # Match by @type OR by having 'offers' key
-                is_product = (
-                    item.get("@type") == "Product"
-                    or item.get("offers")
-                )
-                if not is_product:
-                    continue
-                offers = item.get("offers", {})
-                # Could be a single offer or a list
-                if isinstance(offers, list):
-                    offers = offers[0] if offers else {}
-                price = offers.get("price") or offers.get("lowPrice")
-                if price:
-                    return float(str(price).replace(",", ""))
-        except (json.JSONDecodeError, AttributeError, ValueError, TypeError):
+            offers = item.get("offers", {})
+            # Could be a single offer or a list
+            if isinstance(offers, list):
+                offers = offers[0] if offers else {}
+            price = offers.get("price") or offers.get("lowPrice")
+            if price:
+                return float(str(price).replace(",", ""))
+        except (AttributeError, ValueError, TypeError):
             continue
     return None
 
 
-def extract_price_from_meta(soup: BeautifulSoup) -> float | None:
+def extract_price_from_meta(doc: lxml_html.HtmlElement) -> float | None:
     """Extract price from meta tags (product:price:amount or og:price:amount)."""
     for prop in ["product:price:amount", "og:price:amount"]:
-        tag = soup.find("meta", property=prop)
-        if tag and tag.get("content"):
+        content = _meta_content(doc, prop)
+        if content:
             try:
-                return float(tag["content"].replace(",", ""))
+                return float(content.replace(",", ""))
             except ValueError:
                 continue
     return None
 
 
-def extract_price_from_html_regex(soup: BeautifulSoup, html_text: str) -> float | None:
+def extract_price_from_html_regex(html_text: str) -> float | None:
     """
     Last resort: find ₹X,XXX patterns in the HTML.
     Returns the LOWEST price found (likely the sale/deal price).
     """
-    # Match ₹ followed by a price — e.g. ₹1,199 or ₹55,999.00
-    matches = re.findall(r"₹\s*([\d,]+(?:\.\d{1,2})?)", html_text)
-    if not matches:
+    # str.find runs in C; most pages without ₹ never reach the regex engine
+    start = html_text.find("₹")
+    if start < 0:
         return None
 
-    prices = []
-    for m in matches:
+    # Single streaming pass: keep a running minimum instead of building lists
+    lowest = None
+    for match in _RUPEE_RE.finditer(html_text, start):
+        digits = match.group(1)
+        if "," in digits:
+            digits = digits.replace(",", "")
         try:
-            prices.append(float(m.replace(",", "")))
+            price = float(digits)
         except ValueError:
             continue
-
-    # Filter out tiny values (like ₹19 protect fees) and huge values
-    valid = [p for p in prices if p >= 50]
-    if valid:
-        # The lowest price is typically the sale price
-        return min(valid)
-    return None
-
-
-def scrape_price(soup: BeautifulSoup, platform: str, html_text: str) -> float | None:
+        # Filter out tiny values (like ₹19 protect fees);
+        # the lowest remaining price is typically the sale price
+        if price >= MIN_PLAUSIBLE_PRICE and (lowest is None or price < lowest):
+            lowest = price
+    return lowest
+
+
+def _css_price(doc: lxml_html.HtmlElement, xpath: str) -> float | None:
+    """Return the price in the first element matching a selector."""
+    text = _first_text(doc, xpath)
+    return extract_price(text) if text else None
+
+
+def scrape_price(
+    doc: lxml_html.HtmlElement,
+    platform: str,
+    html_text: str,
+    ld_items: list[dict] | None = None,
+    site_key: str = "",
+) -> float | None:
     """Try multiple strategies to get the product price."""
+    if ld_items is None:
+        ld_items = parse_json_ld(doc)
+
     # Strategy 1: JSON-LD structured data (most reliable)
-    price = extract_price_from_json_ld(soup)
-    if price:
-        log.info("   💲 Price from JSON-LD")
-        return price
+    strategies = [("JSON-LD", lambda: extract_price_from_json_ld(ld_items))]
 
     # Strategy 2: Platform-specific CSS selectors
-    if platform == "amazon":
-        for css in ["span.a-price-whole", "span#priceblock_dealprice",
-                     "span#priceblock_ourprice", "span.a-offscreen",
-                     "div#corePrice_feature_div span.a-price-whole",
-                     "span.priceToPay span.a-price-whole"]:
-            tag = soup.select_one(css)
-            if tag:
-                p = extract_price(tag.get_text())
-                if p:
-                    log.info("   💲 Price from CSS: %s", css)
-                    return p
-
-    if platform == "flipkart":
-        for css in ["div.Nx9bqj.CxhGGd", "div._30jeq3._16Jk6d",
-                     "div._30jeq3", "div.Nx9bqj"]:
-            tag = soup.select_one(css)
-            if tag:
-                p = extract_price(tag.get_text())
-                if p:
-                    log.info("   💲 Price from CSS: %s", css)
-                    return p
+    strategies += [(f"CSS: {css}", functools.partial(_css_price, doc, xpath))
+                   for css, xpath in PRICE_SELECTORS.get(platform, [])]
 
     # Strategy 3: Meta tags
-    price = extract_price_from_meta(soup)
-    if price:
-        log.info("   💲 Price from meta tag")
-        return price
+    strategies.append(("meta tag", lambda: extract_price_from_meta(doc)))
 
     # Strategy 4: Regex on full HTML (last resort)
-    price = extract_price_from_html_regex(soup, html_text)
-    if price:
-        log.info("   💲 Price from HTML regex (₹ pattern)")
-        return price
+    strategies.append(("HTML regex (₹ pattern)",
+                       lambda: extract_price_from_html_regex(html_text)))
 
-    return None
+    return run_strategies(strategies, (site_key, "price"), "   💲 Price from %s")
+
+
+# ── Streaming fetch ──
+
+# Product JSON-LD usually sits in the first ~50KB of a 400KB-1MB page,
+# so the download can stop as soon as it yields both a title and a price
+STREAM_CHUNK_SIZE = 32 * 1024
+EARLY_ABORT_SCAN_LIMIT = 256 * 1024
+_LD_JSON_BLOCK_RE = re.compile(
+    r"<script[^>]*application/ld\+json[^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL
+)
+
+
+def scan_json_ld(html_text: str, start: int = 0) -> tuple[list[dict], int]:
+    """
+    Parse the product JSON-LD blocks that are complete in html_text from
+    start on. Returns (items, offset to resume the next scan from).
+    """
+    items: list[dict] = []
+    for match in _LD_JSON_BLOCK_RE.finditer(html_text, start):
+        items.extend(product_ld_items(match.group(1)))
+        start = match.end()
+    return items, start
+
+
+def fetch_product_html(url: str) -> tuple[int, str, list[dict]] | None:
+    """
+    Stream a product page and return (status_code, html_text, ld_items).
+    JSON-LD blocks are parsed once, as they arrive, and reading stops as soon
+    as they yield a title and price; otherwise the whole page is downloaded.
+    Returns None on HTTP errors.
+    """
+    try:
+        with _SESSION.get(url, timeout=SCRAPE_TIMEOUT, stream=True) as resp:
+            resp.raise_for_status()
+            if resp.encoding is None:
+                resp.encoding = "utf-8"
+
+            parts: list[str] = []
+            size = 0
+            tail = ""  # end of the previous chunk, for tags split across chunks
+            ld_items: list[dict] = []
+            scanned = 0  # blocks before this offset are already in ld_items
+            for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE,
+                                           decode_unicode=True):
+                parts.append(chunk)
+                size += len(chunk)
+                if size <= EARLY_ABORT_SCAN_LIMIT and "</script>" in tail + chunk:
+                    html_text = "".join(parts)
+                    new_items, scanned = scan_json_ld(html_text, scanned)
+                    ld_items += new_items
+                    if (extract_title_from_json_ld(ld_items)
+                            and extract_price_from_json_ld(ld_items)):
+                        log.debug("   ✂️ Product JSON-LD found after %d chars, "
+                                  "stopping download.", size)
+                        return resp.status_code, html_text, ld_items
+                tail = chunk[-(len("</script>") - 1):]
+            html_text = "".join(parts)
+            ld_items += scan_json_ld(html_text, scanned)[0]
+            return resp.status_code, html_text, ld_items
+    except requests.RequestException as exc:
+        log.error("HTTP request failed for %s: %s", url, exc)
+        return None
 
 
 # ── Main scraper ──
 
+# Successful scrapes are reused for a short while, and concurrent lookups of
+# the same URL (a product added twice, /add racing the hourly check) share
+# one download instead of each fetching the page.
+SCRAPE_MEMO_TTL = 60  # seconds
+_scrape_memo: dict[str, tuple[float, dict]] = {}
+_scrape_inflight: dict[str, Future] = {}
+_scrape_memo_lock = threading.Lock()
+
+
 def scrape_product_info(url: str) -> dict | None:
     """
     Scrape a product page and return {'title': ..., 'price': ...}.
@@ -414,35 +809,181 @@ def scrape_product_info(url: str) -> dict | None:
         log.warning("Unsupported platform: %s", url)
         return None
 
+    with _scrape_memo_lock:
+        entry = _scrape_memo.get(url)
+        if entry and time.monotonic() - entry[0] < SCRAPE_MEMO_TTL:
+            return dict(entry[1])
+        pending = _scrape_inflight.get(url)
+        owner = pending is None
+        if owner:
+            pending = _scrape_inflight[url] = Future()
+
+    if not owner:
+        info = pending.result()
+        return dict(info) if info else None
+
+    info = None
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-    except requests.RequestException as exc:
-        log.error("HTTP request failed for %s: %s", url, exc)
+        info = _scrape_page(url, platform)
+    finally:
+        with _scrape_memo_lock:
+            _scrape_inflight.pop(url, None)
+            if info:
+                now = time.monotonic()
+                for stale in [u for u, (ts, _) in _scrape_memo.items()
+                              if now - ts >= SCRAPE_MEMO_TTL]:
+                    del _scrape_memo[stale]
+                _scrape_memo[url] = (now, info)
+        pending.set_result(info)
+    return dict(info) if info else None
+
+
+# At most this many simultaneous page downloads per store, so a parallel
+# check doesn't look like a burst from one client to Amazon/Flipkart.
+PER_HOST_FETCHES = 4
+_host_slots = {p: threading.BoundedSemaphore(PER_HOST_FETCHES) for p in ("amazon", "flipkart")}
+
+
+def _scrape_page(url: str, platform: str) -> dict | None:
+    """Download and parse one product page (uncached)."""
+    with _host_slots[platform]:
+        fetched = fetch_product_html(url)
+    if fetched is None:
         return None
 
-    html_text = resp.text
-    log.info("   📄 HTTP %d | %d chars | JSON-LD: %s | ₹: %s",
-             resp.status_code, len(html_text),
-             "YES" if "application/ld+json" in html_text else "NO",
-             "YES" if "₹" in html_text else "NO")
+    status_code, html_text, ld_items = fetched
+    if log.isEnabledFor(logging.DEBUG):
+        # Two full-page scans just for the banner, so only at DEBUG
+        log.debug("   📄 HTTP %d | %d chars | JSON-LD: %s | ₹: %s",
+                  status_code, len(html_text),
+                  "YES" if "application/ld+json" in html_text else "NO",
+                  "YES" if "₹" in html_text else "NO")
 
-    soup = BeautifulSoup(html_text, "html.parser")
+    doc = parse_html(html_text)
+    if doc is None:
+        return {"title": None, "price": None}
+    site_key = site_key_for(url)
 
-    title = scrape_title(soup, platform)
-    price = scrape_price(soup, platform, html_text)
+    title = scrape_title(doc, platform, ld_items, site_key)
+    price = scrape_price(doc, platform, html_text, ld_items, site_key)
 
     return {"title": title, "price": price}
 
 
+# Product pages are fetched in parallel; the work is network-bound
+SCRAPE_WORKERS = 8
+
+
+def scrape_many(urls: list[str]) -> dict[str, dict | None]:
+    """
+    Scrape several product pages concurrently.
+    Returns {url: info} where info is None if the scrape failed.
+    """
+    def scrape_one(url: str) -> dict | None:
+        try:
+            return scrape_product_info(url)
+        except Exception as exc:
+            log.error("   ❌ Error scraping %s: %s", url, exc)
+            return None
+
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(SCRAPE_WORKERS, len(unique))) as ex:
+        return dict(zip(unique, ex.map(scrape_one, unique)))
+
+
+# The webhook server warms the next hourly check: shortly before it's due,
+# every active product is scraped in the background and phase 2 reuses
+# results that are still fresh instead of fetching them again.
+# The check workflow runs on the hour ("0 * * * *"), so the prefetch is timed
+# from the clock rather than from when the last (possibly late) check ended.
+PREFETCH_LEAD = 5 * 60          # seconds before the hour
+PREFETCH_MAX_AGE = 10 * 60      # older results are re-scraped, never used
+_prefetched: dict[str, tuple[float, dict]] = {}
+_prefetch_lock = threading.Lock()
+_prefetch_scheduled = False
+
+
+def active_product_urls(rows: list[list[str]]) -> list[str]:
+    """URLs of the non-paused products in a Products snapshot."""
+    return [
+        r[1] for r in rows[1:]
+        if len(r) >= 3 and (r[5] if len(r) > 5 else "active") != "paused"
+    ]
+
+
+def seconds_until_prefetch() -> float:
+    """Seconds until PREFETCH_LEAD before the next scheduled hourly check."""
+    now = datetime.now(timezone.utc)
+    next_check = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    wait = (next_check - now).total_seconds() - PREFETCH_LEAD
+    # A check that ran this late is followed almost at once by the next one,
+    # which scrapes for itself; warm the one after that instead
+    return wait if wait > 0 else wait + 3600
+
+
+def schedule_price_prefetch(products_ws: gspread.Worksheet) -> None:
+    """Start the background prefetch for the next check, unless one is pending."""
+    global _prefetch_scheduled
+    with _prefetch_lock:
+        if _prefetch_scheduled:
+            return
+        _prefetch_scheduled = True
+
+    def prefetch() -> None:
+        global _prefetch_scheduled
+        try:
+            time.sleep(seconds_until_prefetch())
+            # A private read: live handlers keep their shared snapshot
+            urls = active_product_urls(products_ws.get_all_values())
+            log.info("🔮 Prefetching %d product(s) for the next check.", len(urls))
+            results = scrape_many(urls)
+            now = time.monotonic()
+            with _prefetch_lock:
+                _prefetched.update(
+                    (url, (now, info)) for url, info in results.items() if info
+                )
+        except Exception as exc:
+            log.warning("Price prefetch failed: %s", exc)
+        finally:
+            with _prefetch_lock:
+                _prefetch_scheduled = False
+
+    threading.Thread(target=prefetch, name="price-prefetch", daemon=True).start()
+
+
+def take_prefetched(urls: list[str]) -> dict[str, dict]:
+    """Pop and return fresh prefetched results for the given URLs."""
+    now = time.monotonic()
+    fresh: dict[str, dict] = {}
+    with _prefetch_lock:
+        for url in urls:
+            entry = _prefetched.pop(url, None)
+            if entry and now - entry[0] <= PREFETCH_MAX_AGE:
+                fresh[url] = entry[1]
+    return fresh
+
+
 # ──────────────────────────── Telegram ───────────────────────────
-def get_telegram_updates(last_update_id: int) -> list[dict]:
-    """Fetch new messages from Telegram using getUpdates."""
+def get_telegram_updates(last_update_id: int, poll_timeout: int = 0) -> list[dict]:
+    """
+    Fetch new messages from Telegram using getUpdates.
+    The standalone run is one-shot, so by default we don't long-poll at all.
+    """
     url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/getUpdates"
-    params = {"offset": last_update_id + 1, "timeout": 5}
+    params = {
+        "offset": last_update_id + 1,
+        "timeout": poll_timeout,
+        "allowed_updates": orjson.dumps(["message"]).decode(),
+    }
 
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _TG_SESSION.get(url, params=params, timeout=(3, poll_timeout + 10))
+        if resp.status_code == 409:
+            # A webhook is registered; Telegram delivers updates there instead.
+            log.info("Telegram webhook is active, skipping getUpdates.")
+            return []
         resp.raise_for_status()
         data = resp.json()
         if data.get("ok"):
@@ -452,6 +993,36 @@ def get_telegram_updates(last_update_id: int) -> list[dict]:
     return []
 
 
+def telegram_webhook_active() -> bool:
+    """True if a webhook is registered, i.e. the server already handles commands."""
+    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/getWebhookInfo"
+    try:
+        resp = _TG_SESSION.get(url, timeout=TG_TIMEOUT)
+        resp.raise_for_status()
+        return bool(resp.json().get("result", {}).get("url"))
+    except requests.RequestException as exc:
+        log.error("Failed to fetch Telegram webhook info: %s", exc)
+        return False
+
+
+# News fan-out, phase 1 and webhook threads all send concurrently; sends are
+# spaced out across threads to stay under Telegram's ~30 msg/s global limit.
+TG_SENDS_PER_SECOND = 25
+_tg_pace_lock = threading.Lock()
+_tg_next_send_at = 0.0
+
+
+def wait_for_send_turn() -> None:
+    """Block until this thread may send, at most TG_SENDS_PER_SECOND overall."""
+    global _tg_next_send_at
+    with _tg_pace_lock:
+        now = time.monotonic()
+        wait = _tg_next_send_at - now
+        _tg_next_send_at = max(now, _tg_next_send_at) + 1 / TG_SENDS_PER_SECOND
+    if wait > 0:
+        time.sleep(wait)
+
+
 def send_telegram_message(message: str, chat_id: str = "") -> bool:
     """Send a message via the Telegram Bot API."""
     api_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
@@ -463,17 +1034,32 @@ def send_telegram_message(message: str, chat_id: str = "") -> bool:
     }
 
     try:
-        resp = requests.post(api_url, json=payload, timeout=15)
+        wait_for_send_turn()
+        resp = _TG_SESSION.post(api_url, data=orjson.dumps(payload),
+                                headers=JSON_HEADERS, timeout=TG_TIMEOUT)
         resp.raise_for_status()
-        log.info("✅ Telegram message sent successfully.")
+        log.debug("✅ Telegram message sent successfully.")
         return True
     except requests.RequestException as exc:
         log.error("Failed to send Telegram message: %s", exc)
         return False
 
 
+# setMyCommands is sent once per process (import-time thread + explicit calls)
+_bot_commands_lock = threading.Lock()
+_bot_commands_registered = False
+REGISTER_ATTEMPTS = 3
+MAX_RETRY_AFTER = 30  # seconds; longer Telegram back-offs aren't worth waiting for
+
+
 def register_bot_commands() -> None:
     """Register bot commands so they appear as a clickable menu in Telegram."""
+    global _bot_commands_registered
+    with _bot_commands_lock:
+        if _bot_commands_registered:
+            return
+        _bot_commands_registered = True
+
     api_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/setMyCommands"
     commands = [
         {"command": "list", "description": "📋 View your watchlist"},
@@ -486,18 +1072,46 @@ def register_bot_commands() -> None:
         {"command": "news", "description": "📰 AI news summary"},
         {"command": "help", "description": "❓ Show all commands"},
     ]
-    try:
-        resp = requests.post(api_url, json={"commands": commands}, timeout=10)
+    body = orjson.dumps({"commands": commands})
+    for attempt in range(1, REGISTER_ATTEMPTS + 1):
+        try:
+            resp = _TG_SESSION.post(api_url, data=body, headers=JSON_HEADERS,
+                                    timeout=TG_TIMEOUT)
+        except requests.RequestException as exc:
+            log.warning("Could not register bot commands: %s", exc)
+            break
         if resp.ok:
             log.info("✅ Bot menu commands registered.")
-        else:
+            return
+        if resp.status_code != 429 or attempt == REGISTER_ATTEMPTS:
             log.warning("Could not register bot commands: %s", resp.text)
-    except requests.RequestException as exc:
-        log.warning("Could not register bot commands: %s", exc)
+            break
+        # Honour Telegram's retry_after; fall back to exponential backoff
+        try:
+            delay = int(resp.json()["parameters"]["retry_after"])
+        except (ValueError, KeyError, TypeError):
+            delay = 2 ** attempt
+        delay = min(delay, MAX_RETRY_AFTER)
+        log.info("Telegram rate limit on setMyCommands, retrying in %ds.", delay)
+        time.sleep(delay)
+
+    # Allow a later call (e.g. the explicit one in main) to try again
+    with _bot_commands_lock:
+        _bot_commands_registered = False
 
 
 # ──────────────────────── Command Parsing ─────────────────────────
 
+_URL_RE = re.compile(r"(https?://\S+)")
+_LEADING_NUM_RE = re.compile(r"(\d+\.?\d*)")
+# Commands may carry the bot's name in group chats, e.g. '/remove@MyBot 2'
+_REMOVE_RE = re.compile(r"/remove(?:@\w+)?\s+(\S+)", re.IGNORECASE)
+_EDIT_RE = re.compile(r"/edit(?:@\w+)?\s+(\d+)\s+(\d+\.?\d*)", re.IGNORECASE)
+_HISTORY_RE = re.compile(r"/history(?:@\w+)?\s+(\d+)", re.IGNORECASE)
+_PAUSE_RE = re.compile(r"/pause(?:@\w+)?\s+(\d+)", re.IGNORECASE)
+_RESUME_RE = re.compile(r"/resume(?:@\w+)?\s+(\d+)", re.IGNORECASE)
+
+
 def detect_url_in_text(text: str) -> tuple[str, float | None] | None:
     """
     Smart URL detection — works with or without /add prefix.
@@ -508,13 +1122,17 @@ def detect_url_in_text(text: str) -> tuple[str, float | None] | None:
       - /add URL price:          /add https://flipkart.com/... 2000
     Returns (url, target_price_or_None) or None if no URL found.
     """
+    # Most chatter names no supported store; skip the URL parsing entirely
+    if _PLATFORM_RE.search(text) is None:
+        return None
+
     cleaned = text.strip()
     # Remove /add prefix if present
     if cleaned.lower().startswith("/add"):
         cleaned = cleaned[4:].strip()
 
     # Find a URL in the text
-    url_match = re.search(r"(https?://\S+)", cleaned)
+    url_match = _URL_RE.search(cleaned)
     if not url_match:
         return None
 
@@ -526,7 +1144,7 @@ def detect_url_in_text(text: str) -> tuple[str, float | None] | None:
 
     # Look for a price number after the URL
     after_url = cleaned[url_match.end():].strip()
-    price_match = re.match(r"(\d+\.?\d*)", after_url)
+    price_match = _LEADING_NUM_RE.match(after_url)
     target_price = float(price_match.group(1)) if price_match else None
 
     return url, target_price
@@ -534,13 +1152,13 @@ def detect_url_in_text(text: str) -> tuple[str, float | None] | None:
 
 def parse_remove_command(text: str) -> str | None:
     """Parse '/remove <n>' or '/remove all'. Returns the argument or None."""
-    match = re.match(r"/remove\s+(\S+)", text.strip(), re.IGNORECASE)
+    match = _REMOVE_RE.match(text.strip())
     return match.group(1) if match else None
 
 
 def parse_edit_command(text: str) -> tuple[int, float] | None:
     """Parse '/edit <n> <new_price>'. Returns (index, new_price) or None."""
-    match = re.match(r"/edit\s+(\d+)\s+(\d+\.?\d*)", text.strip(), re.IGNORECASE)
+    match = _EDIT_RE.match(text.strip())
     if match:
         return int(match.group(1)), float(match.group(2))
     return None
@@ -548,29 +1166,238 @@ def parse_edit_command(text: str) -> tuple[int, float] | None:
 
 def parse_history_command(text: str) -> int | None:
     """Parse '/history <n>'. Returns the index or None."""
-    match = re.match(r"/history\s+(\d+)", text.strip(), re.IGNORECASE)
+    match = _HISTORY_RE.match(text.strip())
     return int(match.group(1)) if match else None
 
 
 def parse_pause_command(text: str) -> int | None:
     """Parse '/pause <n>'. Returns the index or None."""
-    match = re.match(r"/pause\s+(\d+)", text.strip(), re.IGNORECASE)
+    match = _PAUSE_RE.match(text.strip())
     return int(match.group(1)) if match else None
 
 
 def parse_resume_command(text: str) -> int | None:
     """Parse '/resume <n>'. Returns the index or None."""
-    match = re.match(r"/resume\s+(\d+)", text.strip(), re.IGNORECASE)
+    match = _RESUME_RE.match(text.strip())
     return int(match.group(1)) if match else None
 
 
+# In-process snapshot of the Products tab (header included) and the caches
+# derived from it. The TTL bounds staleness from manual sheet edits or other
+# workers for read-only views; writes addressed by row number reload first
+# (reload_product_rows), and our own writes patch or invalidate the caches.
+PRODUCT_CACHE_TTL = 300  # seconds
+_product_rows: list[list[str]] | None = None
+_product_rows_loaded_at = 0.0
+_url_cache: set[str] | None = None
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_product_index: dict[str, set[int]] | None = None
+_product_columns: dict[str, list[str]] | None = None
+# Guards the globals above. Updates publish new lists/sets instead of
+# mutating, so rows a handler already holds never change underneath it.
+_product_cache_lock = threading.RLock()
+# Held around each Products-changing command (and a whole price check) so
+# a handler's read → check → write by row number isn't interleaved.
+products_write_lock = threading.RLock()
+
+
+def normalize_product_url(url: str) -> str:
+    """Reduce a product URL to host + path (drops scheme, query, fragment)."""
+    parts = urlsplit(url.strip())
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def get_product_rows(
+    products_ws: gspread.Worksheet,
+    max_age: float = PRODUCT_CACHE_TTL,
+) -> list[list[str]]:
+    """
+    Return products_ws.get_all_values(), reusing the cached snapshot if it
+    is younger than max_age seconds. Pass max_age=0 to force a reload.
+    """
+    global _product_rows, _product_rows_loaded_at
+    global _url_cache, _product_index, _product_columns
+    with _product_cache_lock:
+        if _product_rows is None or time.monotonic() - _product_rows_loaded_at >= max_age:
+            _product_rows = products_ws.get_all_values()
+            _product_rows_loaded_at = time.monotonic()
+            # Rebuilt from the new snapshot on next use
+            _url_cache = _product_index = _product_columns = None
+        return _product_rows
+
+
+def has_fresh_product_rows() -> bool:
+    """True if get_product_rows() would answer from the cache right now."""
+    with _product_cache_lock:
+        return (_product_rows is not None
+                and time.monotonic() - _product_rows_loaded_at < PRODUCT_CACHE_TTL)
+
+
+def prime_product_rows(rows: list[list[str]]) -> None:
+    """Seed the snapshot with rows read elsewhere (e.g. a batched read)."""
+    global _product_rows, _product_rows_loaded_at
+    global _url_cache, _product_index, _product_columns
+    # values_batch_get trims trailing blanks; pad like get_all_values() does
+    width = max((len(r) for r in rows), default=0)
+    padded = [r + [""] * (width - len(r)) for r in rows]
+    with _product_cache_lock:
+        _product_rows = padded
+        _product_rows_loaded_at = time.monotonic()
+        _url_cache = _product_index = _product_columns = None
+
+
+def get_product_columns(products_ws: gspread.Worksheet) -> dict[str, list[str]]:
+    """
+    Return the watchlist as parallel columns (header excluded):
+    {'names', 'targets', 'currents', 'statuses'}, with the same defaults
+    the command handlers show for short rows.
+    """
+    global _product_columns
+    with _product_cache_lock:
+        rows = get_product_rows(products_ws)[1:]
+        if _product_columns is None:
+            _product_columns = {
+                "names": [r[0] if r else "?" for r in rows],
+                "targets": [r[2] if len(r) > 2 else "?" for r in rows],
+                "currents": [r[3] if len(r) > 3 else "N/A" for r in rows],
+                "statuses": [r[5] if len(r) > 5 else "active" for r in rows],
+            }
+        return _product_columns
+
+
+def _load_url_cache(products_ws: gspread.Worksheet) -> set[str]:
+    """Return the set of tracked URL keys, building it if needed."""
+    global _url_cache
+    with _product_cache_lock:
+        rows = get_product_rows(products_ws)
+        if _url_cache is None:
+            _url_cache = {
+                normalize_product_url(row[1])
+                for row in rows[1:]
+                if len(row) > 1 and row[1]
+            }
+        return _url_cache
+
+
+def get_product_token_index(
+    products_ws: gspread.Worksheet,
+) -> tuple[list[list[str]], dict[str, set[int]]]:
+    """Return (product rows, {name token: row positions}), building if needed."""
+    global _product_index
+    with _product_cache_lock:
+        rows = get_product_rows(products_ws)[1:]  # skip header
+        if _product_index is None:
+            index: dict[str, set[int]] = {}
+            for pos, row in enumerate(rows):
+                if len(row) >= 4 and row[0]:
+                    for token in _TOKEN_RE.findall(row[0].lower()):
+                        index.setdefault(token, set()).add(pos)
+            _product_index = index
+        return rows, _product_index
+
+
+def invalidate_product_caches() -> None:
+    """Drop in-process caches derived from the Products tab after a mutation."""
+    global _product_rows, _url_cache, _product_index, _product_columns
+    with _product_cache_lock:
+        _product_rows = _url_cache = _product_index = _product_columns = None
+
+
+def note_appended_product(row: list[str]) -> None:
+    """Reflect a row we just appended in the caches instead of reloading."""
+    global _product_rows, _url_cache, _product_index, _product_columns
+    with _product_cache_lock:
+        if _product_rows is not None:
+            _product_rows = _product_rows + [row]
+        if _url_cache is not None:
+            _url_cache = _url_cache | {normalize_product_url(row[1])}
+        _product_index = _product_columns = None
+
+
+def note_product_cell(row_number: int, col: int, value: str) -> None:
+    """
+    Reflect a single-cell write (1-indexed, as in update_cell) in the caches.
+    Not for the URL column; that goes through invalidate_product_caches().
+    """
+    global _product_rows, _product_index, _product_columns
+    with _product_cache_lock:
+        if _product_rows is not None and row_number <= len(_product_rows):
+            row = _product_rows[row_number - 1]
+            row = row + [""] * (col - len(row))
+            row[col - 1] = value
+            _product_rows = (_product_rows[:row_number - 1] + [row]
+                             + _product_rows[row_number:])
+        _product_index = _product_columns = None
+
+
+def note_deleted_products(first_row: int, last_row: int) -> None:
+    """Reflect delete_rows(first_row, last_row) in the caches."""
+    global _product_rows, _url_cache, _product_index, _product_columns
+    with _product_cache_lock:
+        if _product_rows is not None:
+            _product_rows = _product_rows[:first_row - 1] + _product_rows[last_row:]
+        _url_cache = _product_index = _product_columns = None
+
+
+# Single-cell Products writes from /edit, /pause and /resume. Phase 1 sets
+# .pending to a dict on its own thread and sends a whole batch of commands'
+# writes in one batch_update; other threads keep writing straight through.
+_product_write_buffer = threading.local()
+
+
+def _buffered_product_writes() -> dict[tuple[int, int], str] | None:
+    """This thread's pending {(row, col): value} writes, or None if unbuffered."""
+    return getattr(_product_write_buffer, "pending", None)
+
+
+def write_product_cell(
+    products_ws: gspread.Worksheet, row_number: int, col: int, value: str,
+) -> None:
+    """update_cell(), deferred to flush_product_writes() while buffering."""
+    pending = _buffered_product_writes()
+    if pending is not None:
+        pending[(row_number, col)] = value
+    else:
+        products_ws.update_cell(row_number, col, value)
+    note_product_cell(row_number, col, value)
+
+
+def flush_product_writes(products_ws: gspread.Worksheet) -> None:
+    """
+    Send this thread's buffered Products cell writes with a single API call.
+    On failure the writes stay queued for the next flush and the patched
+    snapshot is dropped, since it no longer matches the sheet.
+    """
+    pending = _buffered_product_writes()
+    if not pending:
+        return
+    updates = [
+        {"range": gspread.utils.rowcol_to_a1(r, c), "values": [[value]]}
+        for (r, c), value in pending.items()
+    ]
+    try:
+        products_ws.batch_update(updates, value_input_option="USER_ENTERED")
+    except Exception:
+        invalidate_product_caches()
+        raise
+    pending.clear()
+
+
+def reload_product_rows(products_ws: gspread.Worksheet) -> list[list[str]]:
+    """
+    Re-read the Products tab before a write addressed by row number, so a
+    hand edit or another process since the snapshot can't shift the target.
+    Cell writes still waiting in the buffer are re-applied to the new rows.
+    """
+    get_product_rows(products_ws, max_age=0)
+    for (r, c), value in (_buffered_product_writes() or {}).items():
+        note_product_cell(r, c, value)
+    return get_product_rows(products_ws)
+
+
 def is_duplicate_url(products_ws: gspread.Worksheet, url: str) -> bool:
     """Check if a URL is already being tracked."""
-    all_rows = products_ws.get_all_values()
-    for row in all_rows[1:]:
-        if len(row) > 1 and row[1].split("?")[0] == url.split("?")[0]:
-            return True
-    return False
+    return normalize_product_url(url) in _load_url_cache(products_ws)
 
 
 # ──────────────────────── Add Product Logic ───────────────────────
@@ -613,9 +1440,9 @@ def handle_add_product(
     price_str = f"₹{current_price:,.2f}" if current_price else "N/A"
 
     # Append to Google Sheet
-    products_ws.append_row(
-        [name, url, str(target_price), str(current_price or "N/A")]
-    )
+    new_row = [name, url, str(target_price), str(current_price or "N/A")]
+    products_ws.append_row(new_row)
+    note_appended_product(new_row)
     log.info("   ✅ Added '%s' to sheet.", name)
 
     # Build rich confirmation
@@ -640,6 +1467,97 @@ def handle_add_product(
 
 # ──────────────────────── News Logic ───────────────────────
 
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# News feed URLs; {q} is the URL-quoted topic. Google is the default source.
+_RSS_TEMPLATES = {
+    "Google": "https://news.google.com/rss/search?q={q}&hl=en-IN&gl=IN&ceid=IN:en",
+    "Reddit": "https://www.reddit.com/r/{q}/hot/.rss?limit=5",
+    "HN": "https://hnrss.org/newest?q={q}&count=5",
+}
+
+# Feeds and Gemini summaries are reused for a few minutes, so /news saved,
+# the daily digest and repeat requests don't refetch or re-summarize.
+FEED_CACHE_TTL = 300     # seconds
+SUMMARY_CACHE_TTL = 600  # seconds
+_feed_cache: dict[str, tuple[float, list[dict]]] = {}
+_summary_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_news_cache_lock = threading.Lock()
+
+
+def _store_fresh(cache: dict, key: Any, value: Any, ttl: float) -> None:
+    """Store value under key, dropping expired entries. Hold _news_cache_lock."""
+    now = time.monotonic()
+    for stale in [k for k, (ts, _) in cache.items() if now - ts >= ttl]:
+        del cache[stale]
+    cache[key] = (now, value)
+
+
+def fetch_feed(url: str, limit: int | None = None) -> list[dict]:
+    """
+    Fetch an RSS 2.0 or Atom feed and return [{'title': ..., 'link': ...}].
+    Raises on HTTP or XML errors so callers can report the failure.
+    """
+    with _news_cache_lock:
+        cached = _feed_cache.get(url)
+    if cached and time.monotonic() - cached[0] < FEED_CACHE_TTL:
+        entries = cached[1]
+    else:
+        entries = _download_feed(url)
+        with _news_cache_lock:
+            _store_fresh(_feed_cache, url, entries, FEED_CACHE_TTL)
+    # Copies, since callers annotate entries (e.g. with their source)
+    return [dict(e) for e in (entries[:limit] if limit else entries)]
+
+
+def _download_feed(url: str) -> list[dict]:
+    """Download and parse a feed (uncached; see fetch_feed)."""
+    resp = _SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    root = ET.fromstring(resp.content)
+
+    entries = [
+        {"title": (item.findtext("title") or "Untitled").strip(),
+         "link": (item.findtext("link") or "").strip()}
+        for item in root.iter("item")
+    ]
+    if not entries:
+        # Atom (e.g. Reddit): <entry><title/><link href="..."/></entry>
+        for entry in root.iter(f"{_ATOM_NS}entry"):
+            link = entry.find(f"{_ATOM_NS}link")
+            entries.append({
+                "title": (entry.findtext(f"{_ATOM_NS}title") or "Untitled").strip(),
+                "link": link.get("href", "") if link is not None else "",
+            })
+    return entries
+
+
+def cached_summarize(
+    mode: str,
+    topic: str,
+    prompt: str,
+    generation_config: Any = None,
+) -> str:
+    """
+    Run a Gemini prompt, reusing the answer for the same (mode, topic) for
+    SUMMARY_CACHE_TTL. Errors propagate so callers keep their fallbacks.
+    """
+    key = (mode, topic.strip().lower())
+    with _news_cache_lock:
+        cached = _summary_cache.get(key)
+    if cached and time.monotonic() - cached[0] < SUMMARY_CACHE_TTL:
+        log.info("   🧠 Reusing cached %s summary for '%s'", mode, topic)
+        return cached[1]
+
+    if _GEMINI_MODEL is None:
+        raise RuntimeError("GEMINI_API_KEY is not set")
+    summary = _GEMINI_MODEL.generate_content(
+        prompt, generation_config=generation_config).text.strip()
+    with _news_cache_lock:
+        _store_fresh(_summary_cache, key, summary, SUMMARY_CACHE_TTL)
+    return summary
+
+
 # Category presets — shortcuts for common topics
 CATEGORY_PRESETS = {
     "tech": "Technology",
@@ -720,28 +1638,23 @@ def handle_news_command(raw_topic: str, chat_id: str) -> None:
     log.info("📰 News request: topic='%s', lang='%s', detail=%s", topic, language, is_detail)
 
     # 1. Fetch RSS
-    from urllib.parse import quote
-    rss_url = f"https://news.google.com/rss/search?q={quote(topic)}&hl=en-IN&gl=IN&ceid=IN:en"
+    rss_url = _RSS_TEMPLATES["Google"].format(q=quote(topic))
 
     try:
-        feed = feedparser.parse(rss_url)
+        entries = fetch_feed(rss_url, limit=5)
     except Exception as exc:
         log.error("RSS fetch error: %s", exc)
         send_telegram_message("❌ Failed to fetch news.", chat_id)
         return
 
-    entries = feed.entries[:5]
     if not entries:
         send_telegram_message(f"📰 No news found for <b>{topic}</b>.", chat_id)
         return
 
-    headlines = "\n".join(f"- {e.title}" for e in entries)
+    headlines = "\n".join(f"- {e['title']}" for e in entries)
     safe_topic = html.escape(topic)
 
     # 2. Summarize with Gemini
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel("gemini-2.0-flash")
-
     lang_instruction = (
         f" Respond entirely in {language}." if language != "English" else ""
     )
@@ -755,15 +1668,17 @@ def handle_news_command(raw_topic: str, chat_id: str) -> None:
     )
 
     try:
-        response = model.generate_content(prompt)
-        summary = response.text.strip()
+        # Non-English scripts take far more tokens per word, so leave those uncapped
+        gen_cfg = None if language != "English" else (
+            GEN_CFG_LONG if is_detail else GEN_CFG_SHORT)
+        summary = cached_summarize(f"news:{language}:{word_limit}", topic, prompt, gen_cfg)
     except Exception as exc:
         log.error("Gemini API error: %s", exc)
         summary = f"⚠️ AI summary failed. Here are the headlines:\n\n{headlines}"
 
     # 3. Build source links
     links = "\n".join(
-        f'  • <a href="{html.escape(e.link, quote=True)}">{html.escape(e.title[:50])}{"…" if len(e.title) > 50 else ""}</a>'
+        f'  • <a href="{html.escape(e["link"], quote=True)}">{html.escape(e["title"][:50])}{"…" if len(e["title"]) > 50 else ""}</a>'
         for e in entries
     )
 
@@ -771,17 +1686,17 @@ def handle_news_command(raw_topic: str, chat_id: str) -> None:
     bridge_note = ""
     try:
         if GOOGLE_CREDENTIALS and SHEET_ID:
-            sheet = connect_to_sheet()
-            products_ws = get_products_worksheet(sheet)
-            rows = products_ws.get_all_values()[1:]  # skip header
-            topic_lower = topic.lower()
-            for row in rows:
-                if len(row) >= 4 and row[0]:
-                    product_name = row[0].lower()
-                    if (topic_lower in product_name or
-                            any(w in product_name for w in topic_lower.split() if len(w) > 3)):
-                        price_str = row[3] if row[3] else "N/A"
-                        bridge_note += f"\n📌 <i>Related: You're tracking <b>{html.escape(row[0])}</b> (₹{html.escape(price_str)})</i>"
+            rows, index = get_product_token_index(_get_products_ws())
+            topic_tokens = _TOKEN_RE.findall(topic.lower())
+            if len(topic_tokens) > 1:
+                topic_tokens = [w for w in topic_tokens if len(w) > 3]
+            hits: set[int] = set()
+            for token in topic_tokens:
+                hits |= index.get(token, set())
+            for pos in sorted(hits):
+                row = rows[pos]
+                price_str = row[3] if row[3] else "N/A"
+                bridge_note += f"\n📌 <i>Related: You're tracking <b>{html.escape(row[0])}</b> (₹{html.escape(price_str)})</i>"
     except Exception as exc:
         log.debug("News-to-price bridge skipped: %s", exc)
 
@@ -789,9 +1704,8 @@ def handle_news_command(raw_topic: str, chat_id: str) -> None:
     history_note = ""
     try:
         if GOOGLE_CREDENTIALS and SHEET_ID:
-            headlines_hash = hashlib.sha256(headlines.encode("utf-8")).hexdigest()
-            sheet = connect_to_sheet()
-            news_hist_ws = get_news_history_worksheet(sheet)
+            headlines_hash = hashlib.blake2b(headlines.encode("utf-8"), digest_size=8).hexdigest()
+            news_hist_ws = _get_news_history_ws()
             existing = news_hist_ws.get_all_values()[1:]  # skip header
             # Check if same hash exists for this topic in last 10 entries
             for row in reversed(existing[-10:]):
@@ -843,11 +1757,10 @@ def handle_news_save(topic: str, chat_id: str) -> None:
         send_telegram_message("⚠️ Usage: <code>/news save Cricket</code>", chat_id)
         return
     try:
-        sheet = connect_to_sheet()
-        ws = get_news_topics_worksheet(sheet)
-        # Check for duplicates
-        existing = ws.col_values(1)[1:]  # skip header
-        if topic.strip().lower() in [t.lower() for t in existing]:
+        ws = _cached_worksheet("News_Topics", get_news_topics_worksheet)
+        # Check for duplicates (case-insensitive)
+        existing = {t.strip().lower() for t in ws.col_values(1)[1:]}  # skip header
+        if topic.strip().lower() in existing:
             send_telegram_message(f"ℹ️ <b>{topic.strip()}</b> is already saved.", chat_id)
             return
         now_str = now_ist().strftime("%Y-%m-%d %H:%M")
@@ -858,11 +1771,21 @@ def handle_news_save(topic: str, chat_id: str) -> None:
         send_telegram_message("❌ Failed to save topic.", chat_id)
 
 
+# Saved topics are fetched and summarized in parallel (all network-bound)
+NEWS_FANOUT_WORKERS = 8
+
+
+def fan_out_news(topics: list[str], chat_id: str) -> None:
+    """Run handle_news_command for several topics concurrently."""
+    with ThreadPoolExecutor(max_workers=min(NEWS_FANOUT_WORKERS, len(topics)),
+                            thread_name_prefix="news-fanout") as pool:
+        list(pool.map(lambda t: handle_news_command(t, chat_id), topics))
+
+
 def handle_news_saved(chat_id: str) -> None:
     """Fetch news for all saved topics."""
     try:
-        sheet = connect_to_sheet()
-        ws = get_news_topics_worksheet(sheet)
+        ws = _cached_worksheet("News_Topics", get_news_topics_worksheet)
         topics = ws.col_values(1)[1:]  # skip header
     except Exception as exc:
         log.error("Failed to read saved topics: %s", exc)
@@ -874,42 +1797,76 @@ def handle_news_saved(chat_id: str) -> None:
         return
 
     send_telegram_message(f"📰 Fetching news for {len(topics)} saved topics...", chat_id)
-    for t in topics:
-        handle_news_command(t, chat_id)
+    fan_out_news(topics, chat_id)
 
 
 # ──────────────────────── Wave 3: Multi-Source + Deep Search ───────────────────────
 
+# Filler words ignored when comparing headlines across sources
+_HEADLINE_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "at", "by",
+    "with", "is", "are", "was", "as", "from", "breaking", "live", "update",
+})
+_WORD_RE = re.compile(r"\w+")
+
+# Headlines sharing at least this fraction of their words count as one story
+HEADLINE_SIMILARITY = 0.7
+
+
+def headline_words(title: str) -> frozenset[str]:
+    """Canonical form of a headline: its distinct non-filler words."""
+    return frozenset(_WORD_RE.findall(title.lower())) - _HEADLINE_STOPWORDS
+
+
+def dedupe_headlines(entries: list[dict]) -> list[dict]:
+    """
+    Drop entries whose title is an exact or near rewording of an earlier one
+    (Jaccard word similarity >= HEADLINE_SIMILARITY). Jaccard can't exceed
+    the ratio of the two set sizes, so pairs that differ too much in length
+    are skipped without comparing words.
+    """
+    seen: set[frozenset[str]] = set()
+    kept: list[frozenset[str]] = []
+    unique = []
+    for e in entries:
+        words = headline_words(e["title"])
+        if words in seen:
+            continue
+        n = len(words)
+        if any(
+            min(n, len(other)) >= HEADLINE_SIMILARITY * max(n, len(other))
+            and len(words & other) >= HEADLINE_SIMILARITY * len(words | other)
+            for other in kept
+        ):
+            continue
+        seen.add(words)
+        kept.append(words)
+        unique.append(e)
+    return unique
+
+
 def fetch_multi_source_news(topic: str, max_per_source: int = 3) -> list[dict]:
     """Fetch news from multiple RSS sources and merge results."""
-    from urllib.parse import quote
-    sources = {
-        "Google": f"https://news.google.com/rss/search?q={quote(topic)}&hl=en-IN&gl=IN&ceid=IN:en",
-        "Reddit": f"https://www.reddit.com/r/{quote(topic)}/hot/.rss?limit=5",
-        "HN": f"https://hnrss.org/newest?q={quote(topic)}&count=5",
-    }
+    q = quote(topic)
+    sources = {name: tpl.format(q=q) for name, tpl in _RSS_TEMPLATES.items()}
+
+    # Fetch all sources at once; results are merged in the order above
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {
+            name: pool.submit(fetch_feed, url, max_per_source)
+            for name, url in sources.items()
+        }
+
     all_entries = []
-    for source_name, url in sources.items():
+    for source_name, future in futures.items():
         try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:max_per_source]:
-                all_entries.append({
-                    "title": entry.get("title", "Untitled"),
-                    "link": entry.get("link", ""),
-                    "source": source_name,
-                })
+            for entry in future.result():
+                entry["source"] = source_name
+                all_entries.append(entry)
         except Exception as exc:
             log.warning("RSS fetch failed for %s: %s", source_name, exc)
 
-    # Deduplicate by rough title similarity (first 30 chars lowercase)
-    seen = set()
-    unique = []
-    for e in all_entries:
-        key = e["title"][:30].lower().strip()
-        if key not in seen:
-            seen.add(key)
-            unique.append(e)
-    return unique[:7]  # top 7 across sources
+    return dedupe_headlines(all_entries)[:7]  # top 7 across sources
 
 
 def handle_news_multi(raw_topic: str, chat_id: str) -> None:
@@ -930,8 +1887,6 @@ def handle_news_multi(raw_topic: str, chat_id: str) -> None:
 
     headlines = "\n".join(f"- [{e['source']}] {e['title']}" for e in entries)
 
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel("gemini-2.0-flash")
     prompt = (
         f"You are a fun news anchor. Summarize these headlines from multiple sources about "
         f"'{topic}' in under 150 words. Use emojis. Mention which sources reported what. "
@@ -939,7 +1894,7 @@ def handle_news_multi(raw_topic: str, chat_id: str) -> None:
     )
 
     try:
-        summary = model.generate_content(prompt).text.strip()
+        summary = cached_summarize("multi", topic, prompt, GEN_CFG_SHORT)
     except Exception as exc:
         log.error("Gemini API error: %s", exc)
         summary = f"⚠️ AI summary failed.\n\n{headlines}"
@@ -966,21 +1921,18 @@ def handle_news_trending(chat_id: str) -> None:
     rss_url = "https://trends.google.com/trending/rss?geo=IN"
 
     try:
-        feed = feedparser.parse(rss_url)
+        entries = fetch_feed(rss_url, limit=7)
     except Exception as exc:
         log.error("Trends RSS error: %s", exc)
         send_telegram_message("❌ Failed to fetch trending topics.", chat_id)
         return
 
-    entries = feed.entries[:7]
     if not entries:
         send_telegram_message("📰 No trending topics found.", chat_id)
         return
 
-    topics_list = "\n".join(f"- {e.title}" for e in entries)
+    topics_list = "\n".join(f"- {e['title']}" for e in entries)
 
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel("gemini-2.0-flash")
     prompt = (
         f"You are a fun news anchor. Here are today's trending topics in India. "
         f"Give a brief, exciting 1-line description for each. Use emojis. "
@@ -988,7 +1940,7 @@ def handle_news_trending(chat_id: str) -> None:
     )
 
     try:
-        summary = model.generate_content(prompt).text.strip()
+        summary = cached_summarize("trending", "india", prompt, GEN_CFG_SHORT)
     except Exception as exc:
         log.error("Gemini API error: %s", exc)
         summary = topics_list
@@ -998,6 +1950,28 @@ def handle_news_trending(chat_id: str) -> None:
         f"— <i>Powered by Gemini ✨</i>", chat_id)
 
 
+# Only the first ~3000 chars of article text reach Gemini, so the article
+# download is capped; the story body is almost always within this prefix.
+ARTICLE_MAX_BYTES = 200_000
+
+
+def fetch_article_html(url: str) -> bytes:
+    """
+    Download at most ARTICLE_MAX_BYTES of an article page. Raw bytes are
+    returned so trafilatura detects the encoding (headers often omit it).
+    """
+    with _SESSION.get(url, timeout=10, stream=True) as resp:
+        resp.raise_for_status()
+        parts: list[bytes] = []
+        size = 0
+        for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= ARTICLE_MAX_BYTES:
+                break
+        return b"".join(parts)[:ARTICLE_MAX_BYTES]
+
+
 def handle_news_deep(raw_topic: str, chat_id: str) -> None:
     """Deep-read the top article and provide an in-depth summary."""
     if not GEMINI_API_KEY:
@@ -1008,31 +1982,37 @@ def handle_news_deep(raw_topic: str, chat_id: str) -> None:
     log.info("📰 Deep search: topic='%s'", topic)
 
     # Fetch top article from Google News
-    from urllib.parse import quote
-    rss_url = f"https://news.google.com/rss/search?q={quote(topic)}&hl=en-IN&gl=IN&ceid=IN:en"
+    rss_url = _RSS_TEMPLATES["Google"].format(q=quote(topic))
 
     try:
-        feed = feedparser.parse(rss_url)
+        entries = fetch_feed(rss_url, limit=1)
     except Exception as exc:
         log.error("RSS fetch error: %s", exc)
         send_telegram_message("❌ Failed to fetch news.", chat_id)
         return
 
-    if not feed.entries:
+    if not entries:
         send_telegram_message(f"📰 No articles found for <b>{topic}</b>.", chat_id)
         return
 
-    top_entry = feed.entries[0]
-    article_url = top_entry.link
-    article_title = top_entry.title
+    top_entry = entries[0]
+    article_url = top_entry["link"]
+    article_title = top_entry["title"]
+
+    if trafilatura is None:
+        send_telegram_message("⚠️ Deep search needs the trafilatura package. Showing the headline summary instead.", chat_id)
+        handle_news_command(topic, chat_id)
+        return
 
     send_telegram_message(f"🔍 Reading full article: <b>{article_title[:60]}</b>...", chat_id)
 
     # Extract full article text
     try:
-        import trafilatura
-        downloaded = trafilatura.fetch_url(article_url)
-        article_text = trafilatura.extract(downloaded) if downloaded else None
+        downloaded = fetch_article_html(article_url)
+        article_text = trafilatura.extract(
+            downloaded, favor_precision=True,
+            include_comments=False, include_tables=False,
+        ) if downloaded else None
     except Exception as exc:
         log.error("Article extraction error: %s", exc)
         article_text = None
@@ -1045,8 +2025,6 @@ def handle_news_deep(raw_topic: str, chat_id: str) -> None:
     # Truncate to 3000 chars for Gemini
     article_text = article_text[:3000]
 
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel("gemini-2.0-flash")
     prompt = (
         f"You are an expert journalist. Provide a detailed summary of this article about '{topic}'. "
         f"Cover: key facts, who is involved, why it matters, and what happens next. "
@@ -1055,7 +2033,7 @@ def handle_news_deep(raw_topic: str, chat_id: str) -> None:
     )
 
     try:
-        summary = model.generate_content(prompt).text.strip()
+        summary = cached_summarize("deep", topic, prompt, GEN_CFG_LONG)
     except Exception as exc:
         log.error("Gemini API error: %s", exc)
         summary = f"⚠️ AI summary failed.\n\n{article_text[:500]}..."
@@ -1074,8 +2052,9 @@ def send_telegram_voice(audio_path: str, chat_id: str, caption: str = "") -> boo
     """Send a voice message via Telegram Bot API."""
     api_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendVoice"
     try:
+        wait_for_send_turn()
         with open(audio_path, "rb") as audio_file:
-            resp = requests.post(
+            resp = _TG_SESSION.post(
                 api_url,
                 data={"chat_id": chat_id or CHAT_ID, "caption": caption},
                 files={"voice": audio_file},
@@ -1093,8 +2072,9 @@ def send_telegram_photo(image_path: str, chat_id: str, caption: str = "") -> boo
     """Send a photo via Telegram Bot API."""
     api_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendPhoto"
     try:
+        wait_for_send_turn()
         with open(image_path, "rb") as img_file:
-            resp = requests.post(
+            resp = _TG_SESSION.post(
                 api_url,
                 data={
                     "chat_id": chat_id or CHAT_ID,
@@ -1122,42 +2102,39 @@ def handle_news_voice(raw_topic: str, chat_id: str) -> None:
     log.info("🎙️ Voice news: topic='%s'", topic)
 
     # Get headlines
-    from urllib.parse import quote
-    rss_url = f"https://news.google.com/rss/search?q={quote(topic)}&hl=en-IN&gl=IN&ceid=IN:en"
+    rss_url = _RSS_TEMPLATES["Google"].format(q=quote(topic))
 
     try:
-        feed = feedparser.parse(rss_url)
+        entries = fetch_feed(rss_url, limit=5)
     except Exception as exc:
         log.error("RSS error: %s", exc)
         send_telegram_message("❌ Failed to fetch news.", chat_id)
         return
 
-    entries = feed.entries[:5]
     if not entries:
         send_telegram_message(f"📰 No news found for <b>{topic}</b>.", chat_id)
         return
 
-    headlines = "\n".join(f"- {e.title}" for e in entries)
+    headlines = "\n".join(f"- {e['title']}" for e in entries)
 
     # Summarize for speech
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel("gemini-2.0-flash")
     prompt = (
         f"You are a radio news anchor. Read these headlines about '{topic}' in a natural, "
         f"conversational way. Under 100 words. No emojis. No markdown. Plain text only.\n\n{headlines}"
     )
 
     try:
-        summary = model.generate_content(prompt).text.strip()
+        summary = cached_summarize("voice", topic, prompt, GEN_CFG_SHORT)
     except Exception as exc:
         log.error("Gemini error: %s", exc)
-        summary = ". ".join(e.title for e in entries)
+        summary = ". ".join(e["title"] for e in entries)
 
     send_telegram_message(f"🎙️ Generating voice summary for <b>{topic}</b>...", chat_id)
 
     # Generate audio
     try:
-        from gtts import gTTS
+        if gTTS is None:
+            raise RuntimeError("gTTS is not installed")
         tts = gTTS(text=summary, lang="en", slow=False)
         with tempfile.NamedTemporaryFile(suffix=".ogg", delete=False) as tmp:
             tts.save(tmp.name)
@@ -1170,7 +2147,8 @@ def handle_news_voice(raw_topic: str, chat_id: str) -> None:
 
 def generate_news_card_image(topic: str, headlines: list[str], output_path: str) -> None:
     """Generate a styled news card image using Pillow."""
-    from PIL import Image, ImageDraw, ImageFont
+    if Image is None:
+        raise RuntimeError("Pillow is not installed")
 
     W, H = 800, 500
     img = Image.new("RGB", (W, H))
@@ -1223,22 +2201,20 @@ def handle_news_card(raw_topic: str, chat_id: str) -> None:
     topic = raw_topic.strip() or "Technology"
     log.info("🖼️ News card: topic='%s'", topic)
 
-    from urllib.parse import quote
-    rss_url = f"https://news.google.com/rss/search?q={quote(topic)}&hl=en-IN&gl=IN&ceid=IN:en"
+    rss_url = _RSS_TEMPLATES["Google"].format(q=quote(topic))
 
     try:
-        feed = feedparser.parse(rss_url)
+        entries = fetch_feed(rss_url, limit=5)
     except Exception as exc:
         log.error("RSS error: %s", exc)
         send_telegram_message("❌ Failed to fetch news.", chat_id)
         return
 
-    entries = feed.entries[:5]
     if not entries:
         send_telegram_message(f"📰 No news found for <b>{topic}</b>.", chat_id)
         return
 
-    headlines = [e.title for e in entries]
+    headlines = [e["title"] for e in entries]
 
     try:
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
@@ -1262,8 +2238,7 @@ def handle_news_schedule(args: str, chat_id: str) -> None:
         return
 
     try:
-        sheet = connect_to_sheet()
-        settings_ws = get_settings_worksheet(sheet)
+        settings_ws = _cached_worksheet("Settings", get_settings_worksheet)
 
         if action == "on":
             settings_ws.update_acell("B1", "digest_on")
@@ -1288,14 +2263,13 @@ def handle_news_schedule(args: str, chat_id: str) -> None:
 def run_scheduled_digest() -> None:
     """Run the scheduled news digest — called by APScheduler or cron."""
     try:
-        sheet = connect_to_sheet()
-        settings_ws = get_settings_worksheet(sheet)
+        settings_ws = _cached_worksheet("Settings", get_settings_worksheet)
         val = settings_ws.acell("B1").value
         if val != "digest_on":
             log.info("📰 Digest not enabled, skipping.")
             return
 
-        topics_ws = get_news_topics_worksheet(sheet)
+        topics_ws = _cached_worksheet("News_Topics", get_news_topics_worksheet)
         topics = topics_ws.col_values(1)[1:]
         if not topics:
             log.info("📰 No saved topics for digest.")
@@ -1305,8 +2279,7 @@ def run_scheduled_digest() -> None:
             f"🌅 <b>Good Morning! Your Daily News Digest</b>\n\n"
             f"Fetching {len(topics)} topics...", CHAT_ID)
 
-        for t in topics:
-            handle_news_command(t, CHAT_ID)
+        fan_out_news(topics, CHAT_ID)
 
         send_telegram_message("☕ That's your digest! Have a great day.", CHAT_ID)
 
@@ -1314,375 +2287,560 @@ def run_scheduled_digest() -> None:
         log.error("Scheduled digest error: %s", exc)
 
 
-# ══════════════════════════ THREE PHASES ══════════════════════════
+# ──────────────────────── Command Handlers ─────────────────────────
+#
+# Every handler takes (text, chat_id, products_ws, history_ws) and replies
+# via Telegram. Used by both the webhook and the standalone polling phase.
+# Handlers that add a product also return the confirmation message.
 
+CommandHandler = Callable[[str, str, gspread.Worksheet, gspread.Worksheet | None], str | None]
 
-def phase1_process_commands(
-    settings_ws: gspread.Worksheet,
+
+def command_token(text: str) -> str:
+    """Return the lowercased leading '/command' of a message, minus any @botname."""
+    parts = text.split(None, 1)
+    if not parts or not parts[0].startswith("/"):
+        return ""
+    return parts[0].lower().split("@", 1)[0]
+
+
+# '/news <sub> <args>' → handler(args, chat_id). Anything else is a topic.
+NEWS_SUBCOMMANDS: dict[str, Callable[[str, str], None]] = {
+    "saved": lambda args, chat_id: handle_news_saved(chat_id),
+    "save": handle_news_save,
+    "trending": lambda args, chat_id: handle_news_trending(chat_id),
+    "multi": handle_news_multi,
+    "deep": handle_news_deep,
+    "voice": handle_news_voice,
+    "card": handle_news_card,
+    "schedule": handle_news_schedule,
+}
+# Sub-commands that write settings or saved topics; these run in the order
+# they were sent instead of alongside other /news work
+NEWS_ORDERED_SUBCOMMANDS = frozenset({"save", "schedule"})
+
+
+def split_news_command(text: str) -> tuple[str, str, str]:
+    """Split '/news <sub> <args>' into (all args, lowercased sub, sub args)."""
+    args = (text.split(None, 1) + [""])[1].strip()
+    sub, sub_args = (args.split(None, 1) + ["", ""])[:2]
+    return args, sub.lower(), sub_args
+
+
+def dispatch_news_command(text: str, chat_id: str) -> None:
+    """Route '/news …' to the matching news sub-command handler."""
+    args, sub, sub_args = split_news_command(text)
+    handler = NEWS_SUBCOMMANDS.get(sub)
+    if handler:
+        handler(sub_args.strip(), chat_id)
+    else:
+        handle_news_command(args, chat_id)
+
+
+def run_news_job(text: str, chat_id: str) -> None:
+    """dispatch_news_command() for a worker thread, reporting failures to the user."""
+    try:
+        dispatch_news_command(text, chat_id)
+    except Exception as exc:
+        log.error("News command error: %s", exc)
+        send_telegram_message("❌ Something went wrong. Please try again.", chat_id)
+
+
+def handle_news(
+    text: str,
+    chat_id: str,
     products_ws: gspread.Worksheet,
     history_ws: gspread.Worksheet | None = None,
-) -> list[str]:
-    """
-    Phase 1: Process Telegram commands and auto-detected URLs.
-    Returns a list of confirmation messages for newly added products.
-    """
-    log.info("═══ Phase 1: Processing Telegram Commands ═══")
+) -> None:
+    """/news — AI News Summary."""
+    dispatch_news_command(text, chat_id)
 
-    last_update_id = get_last_update_id(settings_ws)
-    updates = get_telegram_updates(last_update_id)
 
-    if not updates:
-        log.info("No new Telegram messages.")
-        return []
+# Row templates for watchlist listings (bound .format, built once)
+WATCHLIST_ROW_FMT = "{icon} {i}. <b>{name}</b>\n   Target: ₹{target} | Last: {current}".format
+PICKER_ROW_FMT = "{icon} {i}. {name}".format
 
-    added_messages: list[str] = []
-    new_last_id = last_update_id
 
-    for update in updates:
-        update_id = update.get("update_id", 0)
-        new_last_id = max(new_last_id, update_id)
+def status_icon(status: str) -> str:
+    """Watchlist icon for a product's Status column."""
+    return "⏸️" if status == "paused" else "🟢"
 
-        message = update.get("message", {})
-        text = message.get("text", "")
-        chat_id = str(message.get("chat", {}).get("id", CHAT_ID))
 
-        if not text:
-            continue
+def add_from_text(text: str, chat_id: str, products_ws: gspread.Worksheet) -> str | None:
+    """Add the product URL found in text, if any. Returns the confirmation."""
+    url_detected = detect_url_in_text(text)
+    if not url_detected:
+        return None
+    url, target_price = url_detected
+    log.info("📥 URL detected: %s (target: %s)", url, target_price or "auto")
+    msg = handle_add_product(products_ws, url, target_price)
+    send_telegram_message(msg, chat_id)
+    return msg
 
-        text_lower = text.strip().lower()
-
-        # ── /news — AI News Summary ──
-        if text_lower.startswith("/news"):
-            args = text[5:].strip()
-            if text_lower.startswith("/news saved"):
-                handle_news_saved(chat_id)
-            elif text_lower.startswith("/news save"):
-                handle_news_save(args[5:].strip(), chat_id)
-            elif text_lower.startswith("/news trending"):
-                handle_news_trending(chat_id)
-            elif text_lower.startswith("/news multi"):
-                handle_news_multi(args[6:].strip(), chat_id)
-            elif text_lower.startswith("/news deep"):
-                handle_news_deep(args[5:].strip(), chat_id)
-            elif text_lower.startswith("/news voice"):
-                handle_news_voice(args[6:].strip(), chat_id)
-            elif text_lower.startswith("/news card"):
-                handle_news_card(args[5:].strip(), chat_id)
-            elif text_lower.startswith("/news schedule"):
-                handle_news_schedule(args[9:].strip(), chat_id)
-            else:
-                handle_news_command(args, chat_id)
-            continue
 
-        # ── /start — Welcome message ──
-        if text_lower.startswith("/start"):
-            send_telegram_message(
-                "🎯 <b>Welcome to Price Drop Hunter!</b>\n\n"
-                "I track prices on <b>Amazon</b> and <b>Flipkart</b> "
-                "and alert you when they drop.\n\n"
-                "<b>How to add a product:</b>\n"
-                "Just paste any Amazon/Flipkart URL!\n\n"
-                "• <code>URL</code> — auto-target 15% below current price\n"
-                "• <code>URL 2000</code> — set ₹2,000 as your target\n\n"
-                "Type /help to see all commands.",
-                chat_id,
-            )
-            continue
+def handle_add(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> str | None:
+    """/add — Add a product by URL (pasting the URL alone works too)."""
+    msg = add_from_text(text, chat_id, products_ws)
+    if msg is None:
+        send_telegram_message(
+            "⚠️ Usage: <code>/add URL PRICE</code>\n"
+            "Only Amazon and Flipkart links are supported.",
+            chat_id,
+        )
+    return msg
 
-        # ── /help — Show all commands ──
-        if text_lower.startswith("/help"):
-            send_telegram_message(
-                "❓ <b>Available Commands</b>\n\n"
-                "<b>Add products:</b>\n"
-                "• Just paste any Flipkart/Amazon URL\n"
-                "• Add a target price after the URL\n"
-                "• Or use: <code>/add URL PRICE</code>\n\n"
-                "<b>Manage watchlist:</b>\n"
-                "• /list — View all tracked products\n"
-                "• /remove 2 — Remove product #2\n"
-                "• /remove all — Clear entire watchlist\n"
-                "• /edit 2 1500 — Change target for #2\n"
-                "• /pause 2 — Pause tracking for #2\n"
-                "• /resume 2 — Resume tracking for #2\n\n"
-                "<b>Info:</b>\n"
-                "• /history 1 — Price history for #1\n"
-                "• /status — Quick summary\n"
-                "• /news <topic> — AI news (try: tech, sports, detail)\n"
-                "• /news save <topic> / saved — Save & fetch topics\n"
-                "• /news multi / trending / deep — Advanced modes\n"
-                "• /news voice / card / schedule — Media & digest\n"
-                "• /help — This message\n\n"
-                "Prices are checked every hour automatically. 🕐",
-                chat_id,
-            )
-            continue
 
-        # ── /status — Quick summary ──
-        if text_lower.startswith("/status"):
-            all_rows = products_ws.get_all_values()
-            count = max(0, len(all_rows) - 1)
-            paused = sum(1 for r in all_rows[1:] if len(r) > 5 and r[5] == "paused")
-            active = count - paused
-            send_telegram_message(
-                f"📊 <b>Status</b>\n\n"
-                f"Products tracked: <b>{count}</b> "
-                f"(🟢 {active} active, ⏸️ {paused} paused)\n"
-                f"Price checks: every 1 hour\n"
-                f"Scraping: Amazon + Flipkart",
-                chat_id,
-            )
-            continue
+def handle_start(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/start — Welcome message."""
+    send_telegram_message(
+        "🎯 <b>Welcome to Price Drop Hunter!</b>\n\n"
+        "I track prices on <b>Amazon</b> and <b>Flipkart</b> "
+        "and alert you when they drop.\n\n"
+        "<b>How to add a product:</b>\n"
+        "Just paste any Amazon/Flipkart URL!\n\n"
+        "• <code>URL</code> — auto-target 15% below current price\n"
+        "• <code>URL 2000</code> — set ₹2,000 as your target\n\n"
+        "Type /help to see all commands.",
+        chat_id,
+    )
 
-        # ── /list — View watchlist ──
-        if text_lower.startswith("/list"):
-            log.info("📋 /list command received.")
-            all_rows = products_ws.get_all_values()
-            if len(all_rows) <= 1:
-                send_telegram_message(
-                    "📋 Your watchlist is empty.\n"
-                    "Just paste any Amazon/Flipkart URL to start tracking!",
-                    chat_id,
-                )
-            else:
-                lines = ["📋 <b>Your Watchlist</b>\n"]
-                for i, row in enumerate(all_rows[1:], 1):
-                    name = row[0] if len(row) > 0 else "?"
-                    target = row[2] if len(row) > 2 else "?"
-                    current = row[3] if len(row) > 3 else "N/A"
-                    status = row[5] if len(row) > 5 else "active"
-                    icon = "⏸️" if status == "paused" else "🟢"
-                    lines.append(
-                        f"{icon} {i}. <b>{name}</b>\n"
-                        f"   Target: ₹{target} | Last: {current}"
-                    )
-                send_telegram_message("\n".join(lines), chat_id)
-            continue
 
-        # ── /remove — Remove product(s) ──
-        if text_lower.strip() == "/remove" or text_lower.strip().startswith("/remove@"):
-            # Bare command — show watchlist + usage
-            all_rows = products_ws.get_all_values()
-            if len(all_rows) <= 1:
-                send_telegram_message("📋 Watchlist is empty — nothing to remove.", chat_id)
-            else:
-                lines = ["🗑️ <b>Which product to remove?</b>\n"]
-                for i, row in enumerate(all_rows[1:], 1):
-                    name = row[0] if len(row) > 0 else "?"
-                    lines.append(f"{i}. {name}")
-                lines.append("\nReply with:\n• <code>/remove 2</code> — remove #2\n• <code>/remove all</code> — clear all")
-                send_telegram_message("\n".join(lines), chat_id)
-            continue
+def handle_help(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/help — Show all commands."""
+    send_telegram_message(
+        "❓ <b>Available Commands</b>\n\n"
+        "<b>Add products:</b>\n"
+        "• Just paste any Flipkart/Amazon URL\n"
+        "• Add a target price after the URL\n"
+        "• Or use: <code>/add URL PRICE</code>\n\n"
+        "<b>Manage watchlist:</b>\n"
+        "• /list — View all tracked products\n"
+        "• /remove 2 — Remove product #2\n"
+        "• /remove all — Clear entire watchlist\n"
+        "• /edit 2 1500 — Change target for #2\n"
+        "• /pause 2 — Pause tracking for #2\n"
+        "• /resume 2 — Resume tracking for #2\n\n"
+        "<b>Info:</b>\n"
+        "• /history 1 — Price history for #1\n"
+        "• /status — Quick summary\n"
+        "• /news <topic> — AI news (try: tech, sports, detail)\n"
+        "• /news save <topic> / saved — Save & fetch topics\n"
+        "• /news multi / trending / deep — Advanced modes\n"
+        "• /news voice / card / schedule — Media & digest\n"
+        "• /help — This message\n\n"
+        "Prices are checked every hour automatically. 🕐",
+        chat_id,
+    )
 
-        remove_arg = parse_remove_command(text)
-        if remove_arg is not None:
-            all_rows = products_ws.get_all_values()
-            data_count = len(all_rows) - 1
 
-            if remove_arg.lower() == "all":
-                if data_count <= 0:
-                    send_telegram_message("📋 Watchlist is already empty.", chat_id)
-                else:
-                    # Delete all data rows (keep header)
-                    for row_idx in range(data_count + 1, 1, -1):
-                        products_ws.delete_rows(row_idx)
-                    send_telegram_message(
-                        f"🗑️ Cleared <b>{data_count}</b> product(s) from your watchlist.",
-                        chat_id,
-                    )
-                    log.info("   🗑️ Cleared all %d products.", data_count)
-                continue
+def handle_status(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/status — Quick summary."""
+    if has_fresh_product_rows():
+        statuses = get_product_columns(products_ws)["statuses"]
+        count = len(statuses)
+        paused = statuses.count("paused")
+    else:
+        # Cold cache: two thin columns instead of the whole tab
+        names, status_cells = products_ws.batch_get(["A2:A", "F2:F"])
+        count = len(names)
+        paused = [r[0] for r in status_cells if r].count("paused")
+    active = count - paused
+    send_telegram_message(
+        f"📊 <b>Status</b>\n\n"
+        f"Products tracked: <b>{count}</b> "
+        f"(🟢 {active} active, ⏸️ {paused} paused)\n"
+        f"Price checks: every 1 hour\n"
+        f"Scraping: Amazon + Flipkart",
+        chat_id,
+    )
 
-            try:
-                idx = int(remove_arg)
-            except ValueError:
-                send_telegram_message(
-                    "⚠️ Usage: <code>/remove 2</code> or <code>/remove all</code>",
-                    chat_id,
-                )
-                continue
 
-            if idx < 1 or idx > data_count:
-                send_telegram_message(
-                    f"⚠️ Invalid number. You have {data_count} product(s). "
-                    f"Use /list to see them.",
-                    chat_id,
-                )
-            else:
-                removed_name = all_rows[idx][0] if len(all_rows[idx]) > 0 else "?"
-                products_ws.delete_rows(idx + 1)  # +1 for header
-                send_telegram_message(
-                    f"🗑️ Removed <b>{removed_name}</b> from your watchlist.",
-                    chat_id,
-                )
-                log.info("   🗑️ Removed row %d: '%s'", idx, removed_name)
-            continue
+def handle_list(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/list — View watchlist."""
+    log.info("📋 /list command received.")
+    cols = get_product_columns(products_ws)
+    if not cols["names"]:
+        send_telegram_message(
+            "📋 Your watchlist is empty.\n"
+            "Just paste any Amazon/Flipkart URL to start tracking!",
+            chat_id,
+        )
+        return
 
-        # ── /edit — Change target price ──
-        if text_lower.strip() == "/edit" or text_lower.strip().startswith("/edit@"):
-            # Bare command — show watchlist + usage
-            all_rows = products_ws.get_all_values()
-            if len(all_rows) <= 1:
-                send_telegram_message("📋 Watchlist is empty — nothing to edit.", chat_id)
-            else:
-                lines = ["✏️ <b>Which product to edit?</b>\n"]
-                for i, row in enumerate(all_rows[1:], 1):
-                    name = row[0] if len(row) > 0 else "?"
-                    target = row[2] if len(row) > 2 else "?"
-                    lines.append(f"{i}. {name} (target: ₹{target})")
-                lines.append("\nReply with:\n• <code>/edit 2 1500</code> — set #2 target to ₹1,500")
-                send_telegram_message("\n".join(lines), chat_id)
-            continue
+    body = "\n".join(
+        WATCHLIST_ROW_FMT(icon=status_icon(status), i=i, name=name,
+                          target=target, current=current)
+        for i, (name, target, current, status) in enumerate(
+            zip(cols["names"], cols["targets"], cols["currents"], cols["statuses"]), 1)
+    )
+    send_telegram_message(f"📋 <b>Your Watchlist</b>\n\n{body}", chat_id)
 
-        edit_parsed = parse_edit_command(text)
-        if edit_parsed:
-            idx, new_price = edit_parsed
-            all_rows = products_ws.get_all_values()
-            data_count = len(all_rows) - 1
-
-            if idx < 1 or idx > data_count:
-                send_telegram_message(
-                    f"⚠️ Invalid number. You have {data_count} product(s). "
-                    f"Use /list to see them.",
-                    chat_id,
-                )
-            else:
-                name = all_rows[idx][0] if len(all_rows[idx]) > 0 else "?"
-                products_ws.update_cell(idx + 1, 3, str(new_price))  # +1 for header
-                send_telegram_message(
-                    f"✏️ Updated target for <b>{name}</b> to ₹{new_price:,.0f}",
-                    chat_id,
-                )
-                log.info("   ✏️ Updated target for '%s' → ₹%.0f", name, new_price)
-            continue
 
-        # ── /history — Show price history ──
-        if text_lower.strip() == "/history" or text_lower.strip().startswith("/history@"):
-            all_rows = products_ws.get_all_values()
-            if len(all_rows) <= 1:
-                send_telegram_message("📋 Watchlist is empty — nothing to show.", chat_id)
-            else:
-                lines = ["📜 <b>Which product's history?</b>\n"]
-                for i, row in enumerate(all_rows[1:], 1):
-                    name = row[0] if len(row) > 0 else "?"
-                    lines.append(f"{i}. {name}")
-                lines.append("\nReply with:\n• <code>/history 1</code> — show history for #1")
-                send_telegram_message("\n".join(lines), chat_id)
-            continue
+def handle_remove(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/remove — Remove product(s)."""
+    remove_arg = parse_remove_command(text)
+    # Deletes go by row number, so they work from a fresh read
+    all_rows = (get_product_rows(products_ws) if remove_arg is None
+                else reload_product_rows(products_ws))
+    data_count = len(all_rows) - 1
+
+    if remove_arg is None:
+        # Bare command — show watchlist + usage
+        if data_count <= 0:
+            send_telegram_message("📋 Watchlist is empty — nothing to remove.", chat_id)
+            return
+        lines = ["🗑️ <b>Which product to remove?</b>\n"]
+        for i, row in enumerate(all_rows[1:], 1):
+            name = row[0] if len(row) > 0 else "?"
+            lines.append(f"{i}. {name}")
+        lines.append("\nReply with:\n• <code>/remove 2</code> — remove #2\n• <code>/remove all</code> — clear all")
+        send_telegram_message("\n".join(lines), chat_id)
+        return
 
-        history_idx = parse_history_command(text)
-        if history_idx is not None:
-            all_rows = products_ws.get_all_values()
-            data_count = len(all_rows) - 1
-            if history_idx < 1 or history_idx > data_count:
-                send_telegram_message(
-                    f"⚠️ Invalid number. You have {data_count} product(s). "
-                    f"Use /list to see them.", chat_id,
-                )
-            elif history_ws:
-                product_name = all_rows[history_idx][0]
-                hist_rows = history_ws.get_all_values()
-                matches = [r for r in hist_rows[1:] if r[1] == product_name]
-                if not matches:
-                    send_telegram_message(
-                        f"📜 No history yet for <b>{product_name}</b>.\n"
-                        "History is recorded during hourly price checks.",
-                        chat_id,
-                    )
-                else:
-                    recent = matches[-10:]  # Last 10 entries
-                    lines = [f"📜 <b>Price History: {product_name}</b>\n"]
-                    for entry in reversed(recent):
-                        date = entry[0] if len(entry) > 0 else "?"
-                        price = entry[2] if len(entry) > 2 else "?"
-                        lines.append(f"  {date} — ₹{price}")
-                    send_telegram_message("\n".join(lines), chat_id)
-            else:
-                send_telegram_message("⚠️ Price history is not available.", chat_id)
-            continue
+    if remove_arg.lower() == "all":
+        if data_count <= 0:
+            send_telegram_message("📋 Watchlist is already empty.", chat_id)
+            return
+        # Delete all data rows (keep header) in one request
+        flush_product_writes(products_ws)  # queued writes use current row numbers
+        products_ws.delete_rows(2, data_count + 1)
+        note_deleted_products(2, data_count + 1)
+        send_telegram_message(
+            f"🗑️ Cleared <b>{data_count}</b> product(s) from your watchlist.",
+            chat_id,
+        )
+        log.info("   🗑️ Cleared all %d products.", data_count)
+        return
 
-        # ── /pause — Pause tracking ──
-        if text_lower.strip() == "/pause" or text_lower.strip().startswith("/pause@"):
-            all_rows = products_ws.get_all_values()
-            if len(all_rows) <= 1:
-                send_telegram_message("📋 Watchlist is empty.", chat_id)
-            else:
-                lines = ["⏸️ <b>Which product to pause?</b>\n"]
-                for i, row in enumerate(all_rows[1:], 1):
-                    name = row[0] if len(row) > 0 else "?"
-                    status = row[5] if len(row) > 5 else "active"
-                    icon = "⏸️" if status == "paused" else "🟢"
-                    lines.append(f"{icon} {i}. {name}")
-                lines.append("\nReply with:\n• <code>/pause 1</code> — pause #1")
-                send_telegram_message("\n".join(lines), chat_id)
-            continue
+    try:
+        idx = int(remove_arg)
+    except ValueError:
+        send_telegram_message(
+            "⚠️ Usage: <code>/remove 2</code> or <code>/remove all</code>",
+            chat_id,
+        )
+        return
 
-        pause_idx = parse_pause_command(text)
-        if pause_idx is not None:
-            all_rows = products_ws.get_all_values()
-            data_count = len(all_rows) - 1
-            if pause_idx < 1 or pause_idx > data_count:
-                send_telegram_message(
-                    f"⚠️ Invalid number. You have {data_count} product(s).", chat_id,
-                )
-            else:
-                name = all_rows[pause_idx][0] if len(all_rows[pause_idx]) > 0 else "?"
-                products_ws.update_cell(pause_idx + 1, 6, "paused")
-                send_telegram_message(
-                    f"⏸️ Paused tracking for <b>{name}</b>.\n"
-                    f"Use <code>/resume {pause_idx}</code> to resume.",
-                    chat_id,
-                )
-                log.info("   ⏸️ Paused '%s'.", name)
-            continue
+    if idx < 1 or idx > data_count:
+        send_telegram_message(
+            f"⚠️ Invalid number. You have {data_count} product(s). "
+            f"Use /list to see them.",
+            chat_id,
+        )
+        return
 
-        # ── /resume — Resume tracking ──
-        if text_lower.strip() == "/resume" or text_lower.strip().startswith("/resume@"):
-            all_rows = products_ws.get_all_values()
-            if len(all_rows) <= 1:
-                send_telegram_message("📋 Watchlist is empty.", chat_id)
-            else:
-                lines = ["▶️ <b>Which product to resume?</b>\n"]
-                for i, row in enumerate(all_rows[1:], 1):
-                    name = row[0] if len(row) > 0 else "?"
-                    status = row[5] if len(row) > 5 else "active"
-                    icon = "⏸️" if status == "paused" else "🟢"
-                    lines.append(f"{icon} {i}. {name}")
-                lines.append("\nReply with:\n• <code>/resume 1</code> — resume #1")
-                send_telegram_message("\n".join(lines), chat_id)
-            continue
+    removed_name = all_rows[idx][0] if len(all_rows[idx]) > 0 else "?"
+    flush_product_writes(products_ws)  # queued writes use current row numbers
+    products_ws.delete_rows(idx + 1)  # +1 for header
+    note_deleted_products(idx + 1, idx + 1)
+    send_telegram_message(
+        f"🗑️ Removed <b>{removed_name}</b> from your watchlist.",
+        chat_id,
+    )
+    log.info("   🗑️ Removed row %d: '%s'", idx, removed_name)
 
-        resume_idx = parse_resume_command(text)
-        if resume_idx is not None:
-            all_rows = products_ws.get_all_values()
-            data_count = len(all_rows) - 1
-            if resume_idx < 1 or resume_idx > data_count:
-                send_telegram_message(
-                    f"⚠️ Invalid number. You have {data_count} product(s).", chat_id,
-                )
-            else:
-                name = all_rows[resume_idx][0] if len(all_rows[resume_idx]) > 0 else "?"
-                products_ws.update_cell(resume_idx + 1, 6, "active")
-                send_telegram_message(
-                    f"▶️ Resumed tracking for <b>{name}</b>.",
-                    chat_id,
-                )
-                log.info("   ▶️ Resumed '%s'.", name)
-            continue
 
-        # ── Auto-detect URL (no /add needed) ──
-        url_detected = detect_url_in_text(text)
-        if url_detected:
-            url, target_price = url_detected
-            log.info("📥 URL detected: %s (target: %s)", url, target_price or "auto")
-            msg = handle_add_product(products_ws, url, target_price)
-            added_messages.append(msg)
-            send_telegram_message(msg, chat_id)
-            continue
+def handle_edit(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/edit — Change target price."""
+    edit_parsed = parse_edit_command(text)
+    all_rows = (get_product_rows(products_ws) if edit_parsed is None
+                else reload_product_rows(products_ws))
+    data_count = len(all_rows) - 1
+
+    if edit_parsed is None:
+        # Bare command — show watchlist + usage
+        if data_count <= 0:
+            send_telegram_message("📋 Watchlist is empty — nothing to edit.", chat_id)
+            return
+        lines = ["✏️ <b>Which product to edit?</b>\n"]
+        for i, row in enumerate(all_rows[1:], 1):
+            name = row[0] if len(row) > 0 else "?"
+            target = row[2] if len(row) > 2 else "?"
+            lines.append(f"{i}. {name} (target: ₹{target})")
+        lines.append("\nReply with:\n• <code>/edit 2 1500</code> — set #2 target to ₹1,500")
+        send_telegram_message("\n".join(lines), chat_id)
+        return
+
+    idx, new_price = edit_parsed
+    if idx < 1 or idx > data_count:
+        send_telegram_message(
+            f"⚠️ Invalid number. You have {data_count} product(s). "
+            f"Use /list to see them.",
+            chat_id,
+        )
+        return
+
+    name = all_rows[idx][0] if len(all_rows[idx]) > 0 else "?"
+    write_product_cell(products_ws, idx + 1, 3, str(new_price))  # +1 for header
+    send_telegram_message(
+        f"✏️ Updated target for <b>{name}</b> to ₹{new_price:,.0f}",
+        chat_id,
+    )
+    log.info("   ✏️ Updated target for '%s' → ₹%.0f", name, new_price)
+
+
+def handle_history(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/history — Show price history."""
+    history_idx = parse_history_command(text)
+    all_rows = get_product_rows(products_ws)
+    data_count = len(all_rows) - 1
+
+    if history_idx is None:
+        # Bare command — show watchlist + usage
+        if data_count <= 0:
+            send_telegram_message("📋 Watchlist is empty — nothing to show.", chat_id)
+            return
+        lines = ["📜 <b>Which product's history?</b>\n"]
+        for i, row in enumerate(all_rows[1:], 1):
+            name = row[0] if len(row) > 0 else "?"
+            lines.append(f"{i}. {name}")
+        lines.append("\nReply with:\n• <code>/history 1</code> — show history for #1")
+        send_telegram_message("\n".join(lines), chat_id)
+        return
+
+    if history_idx < 1 or history_idx > data_count:
+        send_telegram_message(
+            f"⚠️ Invalid number. You have {data_count} product(s). "
+            f"Use /list to see them.", chat_id,
+        )
+        return
+
+    if not history_ws:
+        send_telegram_message("⚠️ Price history is not available.", chat_id)
+        return
+
+    product_name = all_rows[history_idx][0]
+    matches = get_history_index(history_ws).get(product_name, ())
+    if not matches:
+        send_telegram_message(
+            f"📜 No history yet for <b>{product_name}</b>.\n"
+            "History is recorded during hourly price checks.",
+            chat_id,
+        )
+        return
+
+    lines = [f"📜 <b>Price History: {product_name}</b>\n"]
+    for entry in reversed(matches):  # Last HISTORY_SHOWN entries, newest first
+        date = entry[0] if len(entry) > 0 else "?"
+        price = entry[2] if len(entry) > 2 else "?"
+        lines.append(f"  {date} — ₹{price}")
+    send_telegram_message("\n".join(lines), chat_id)
+
+
+def _set_product_status(
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    parsed_idx: int | None,
+    new_status: str,
+) -> None:
+    """Shared body of /pause and /resume."""
+    if parsed_idx is not None:
+        reload_product_rows(products_ws)  # the write goes by row number
+    cols = get_product_columns(products_ws)
+    data_count = len(cols["names"])
+    verb = "pause" if new_status == "paused" else "resume"
+
+    if parsed_idx is None:
+        # Bare command — show watchlist + usage
+        if data_count <= 0:
+            send_telegram_message("📋 Watchlist is empty.", chat_id)
+            return
+        header = ("⏸️ <b>Which product to pause?</b>\n" if verb == "pause"
+                  else "▶️ <b>Which product to resume?</b>\n")
+        lines = [header]
+        lines.extend(
+            PICKER_ROW_FMT(icon=status_icon(status), i=i, name=name)
+            for i, (name, status) in enumerate(zip(cols["names"], cols["statuses"]), 1)
+        )
+        lines.append(f"\nReply with:\n• <code>/{verb} 1</code> — {verb} #1")
+        send_telegram_message("\n".join(lines), chat_id)
+        return
+
+    if parsed_idx < 1 or parsed_idx > data_count:
+        send_telegram_message(
+            f"⚠️ Invalid number. You have {data_count} product(s).", chat_id,
+        )
+        return
+
+    name = cols["names"][parsed_idx - 1]
+    write_product_cell(products_ws, parsed_idx + 1, 6, new_status)
+    if verb == "pause":
+        send_telegram_message(
+            f"⏸️ Paused tracking for <b>{name}</b>.\n"
+            f"Use <code>/resume {parsed_idx}</code> to resume.",
+            chat_id,
+        )
+        log.info("   ⏸️ Paused '%s'.", name)
+    else:
+        send_telegram_message(
+            f"▶️ Resumed tracking for <b>{name}</b>.",
+            chat_id,
+        )
+        log.info("   ▶️ Resumed '%s'.", name)
+
+
+def handle_pause(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/pause — Pause tracking."""
+    _set_product_status(chat_id, products_ws, parse_pause_command(text), "paused")
+
+
+def handle_resume(
+    text: str,
+    chat_id: str,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+) -> None:
+    """/resume — Resume tracking."""
+    _set_product_status(chat_id, products_ws, parse_resume_command(text), "active")
+
+
+# '/command' → handler; anything else falls through to URL auto-detection
+COMMAND_HANDLERS: dict[str, CommandHandler] = {
+    "/add": handle_add,
+    "/news": handle_news,
+    "/start": handle_start,
+    "/help": handle_help,
+    "/status": handle_status,
+    "/list": handle_list,
+    "/remove": handle_remove,
+    "/edit": handle_edit,
+    "/history": handle_history,
+    "/pause": handle_pause,
+    "/resume": handle_resume,
+}
+
+
+# ══════════════════════════ THREE PHASES ══════════════════════════
+
+
+# Phase 1 batching: getUpdates page size, how often the offset is saved, and
+# how many /news requests run alongside the command loop
+TELEGRAM_UPDATES_PAGE = 100
+UPDATE_ID_COMMIT_EVERY = 20
+PHASE1_NEWS_WORKERS = 4
+
+
+def phase1_process_commands(
+    settings_ws: gspread.Worksheet,
+    products_ws: gspread.Worksheet,
+    history_ws: gspread.Worksheet | None = None,
+    last_update_id: int | None = None,
+) -> list[str]:
+    """
+    Phase 1: Process Telegram commands and auto-detected URLs.
+    Returns a list of confirmation messages for newly added products.
+    last_update_id is read from Settings unless the caller already has it.
+    """
+    log.info("═══ Phase 1: Processing Telegram Commands ═══")
+
+    if last_update_id is None:
+        last_update_id = get_last_update_id(settings_ws)
+
+    added_messages: list[str] = []
+    committed_id = new_last_id = last_update_id
+    handled = 0
+    news_jobs: list[Future] = []  # waited on before each checkpoint
+
+    # Fetching news can take a while (feeds + Gemini) and only appends to
+    # News_History, so it runs in the background. /news save and schedule
+    # write settings and stay in order on this thread with everything else.
+    _product_write_buffer.pending = {}  # /edit, /pause, /resume writes go out in batches
+    try:
+        with ThreadPoolExecutor(max_workers=PHASE1_NEWS_WORKERS,
+                                thread_name_prefix="phase1-news") as news_pool:
+            while True:
+                # getUpdates returns at most 100 updates; page through the backlog
+                updates = get_telegram_updates(new_last_id)
+                for update in updates:
+                    update_id = update.get("update_id", 0)
+                    new_last_id = max(new_last_id, update_id)
+
+                    message = update.get("message") or {}
+                    text = message.get("text") or ""
+                    chat_id = str((message.get("chat") or {}).get("id") or CHAT_ID)
+
+                    command = command_token(text)
+                    if (command == "/news" and split_news_command(text)[1]
+                            not in NEWS_ORDERED_SUBCOMMANDS):
+                        news_jobs.append(news_pool.submit(run_news_job, text, chat_id))
+                    else:
+                        added = process_single_message(text, chat_id, products_ws,
+                                                       history_ws, command)
+                        if added:
+                            added_messages.append(added)
+
+                    # Checkpoint periodically so a crash doesn't replay the backlog
+                    handled += 1
+                    if handled % UPDATE_ID_COMMIT_EVERY == 0:
+                        # Only commit update_ids whose /news jobs have finished
+                        for job in news_jobs:
+                            job.result()
+                        news_jobs.clear()
+                        flush_product_writes(products_ws)
+                        set_last_update_id(settings_ws, new_last_id)
+                        committed_id = new_last_id
+
+                if len(updates) < TELEGRAM_UPDATES_PAGE:
+                    break
+    finally:
+        try:
+            flush_product_writes(products_ws)
+        finally:
+            _product_write_buffer.pending = None
+
+    if not handled:
+        log.info("No new Telegram messages.")
+        return []
 
     # Update the last processed ID
-    if new_last_id > last_update_id:
+    if new_last_id > committed_id:
         set_last_update_id(settings_ws, new_last_id)
-        log.info("Updated last_update_id → %d", new_last_id)
+    log.info("Processed %d update(s); last_update_id → %d", handled, new_last_id)
 
     return added_messages
 
@@ -1690,108 +2848,127 @@ def phase1_process_commands(
 def phase2_check_prices(
     products_ws: gspread.Worksheet,
     history_ws: gspread.Worksheet | None = None,
-) -> tuple[list[dict], list[dict]]:
+) -> tuple[list[dict], list[dict], int]:
     """
     Phase 2: Read all products from the sheet, scrape live prices,
     update the Current_Price column, log history, and return
-    (alerts, changes).
+    (alerts, changes, number of product rows read).
     """
     log.info("═══ Phase 2: Checking Live Prices ═══")
 
-    all_rows = products_ws.get_all_values()
+    # Always reload: prices are written back by row number
+    all_rows = get_product_rows(products_ws, max_age=0)
     if len(all_rows) <= 1:
         log.info("No products in the sheet.")
-        return [], []
+        return [], [], 0
 
     alerts: list[dict] = []
     changes: list[dict] = []  # All price movements
+    cell_updates: list[dict] = []  # Written in one batch_update at the end
     checked = 0
 
+    # Pick the rows to check: (sheet row number, row, target price)
+    total = len(all_rows) - 1
+    active_rows: list[tuple[int, list[str], float]] = []
     for i, row in enumerate(all_rows[1:], 2):  # row 2 onwards (1-indexed in Sheets)
         if len(row) < 3:
             continue
-
-        name = row[0]
-        url = row[1]
-        target = float(row[2])
-        old_price_str = row[3] if len(row) > 3 else "N/A"
-        last_alerted_str = row[4] if len(row) > 4 else ""
-        status = row[5] if len(row) > 5 else "active"
-
-        # Skip paused products
-        if status == "paused":
-            log.info("⏸️  [%d/%d] %s — paused, skipping.", i - 1, len(all_rows) - 1, name)
+        if (row[5] if len(row) > 5 else "active") == "paused":
+            log.info("⏸️  [%d/%d] %s — paused, skipping.", i - 1, total, row[0])
             continue
-
-        # Parse old price for comparison
         try:
-            old_price = float(old_price_str) if old_price_str != "N/A" else None
+            active_rows.append((i, row, float(row[2])))
         except ValueError:
-            old_price = None
+            log.warning("⚠️  [%d/%d] %s — invalid target '%s', skipping.",
+                        i - 1, total, row[0], row[2])
 
-        log.info("🔍 [%d/%d] %s", i - 1, len(all_rows) - 1, name)
+    # Rows queued for Price_History are written even if a later product or
+    # the cell batch fails, so a partial run still keeps its history
+    try:
+        # Fetch every active product page up front. Sheet updates, history and
+        # alerts are then applied single-threaded, in sheet order.
+        urls = [row[1] for _, row, _ in active_rows]
+        scraped = take_prefetched(urls)
+        if scraped:
+            log.info("🔮 Using %d prefetched result(s).", len(scraped))
+        scraped.update(scrape_many([u for u in urls if u not in scraped]))
+
+        for i, row, target in active_rows:
+            name = row[0]
+            url = row[1]
+            old_price_str = row[3] if len(row) > 3 else "N/A"
+            last_alerted_str = row[4] if len(row) > 4 else ""
+
+            # Parse old price for comparison
+            try:
+                old_price = float(old_price_str) if old_price_str != "N/A" else None
+            except ValueError:
+                old_price = None
 
-        try:
-            info = scrape_product_info(url)
-        except Exception as exc:
-            log.error("   ❌ Error scraping '%s': %s", name, exc)
-            continue
+            log.info("🔍 [%d/%d] %s", i - 1, total, name)
 
-        if not info or info.get("price") is None:
-            log.warning("   ⚠️  Could not get price for '%s'.", name)
-            continue
+            info = scraped.get(url)
+            if not info or info.get("price") is None:
+                log.warning("   ⚠️  Could not get price for '%s'.", name)
+                continue
 
-        live_price = info["price"]
-        checked += 1
-        log.info("   💰 ₹%.2f (target ₹%.0f)", live_price, target)
+            live_price = info["price"]
+            checked += 1
+            log.info("   💰 ₹%.2f (target ₹%.0f)", live_price, target)
 
-        # Update Current_Price in the sheet (column D)
-        try:
-            products_ws.update_cell(i, 4, f"{live_price:.2f}")
-        except Exception as exc:
-            log.warning("   Could not update sheet cell: %s", exc)
+            # Update Current_Price in the sheet (column D)
+            cell_updates.append({"range": f"D{i}", "values": [[f"{live_price:.2f}"]]})
 
-        # Log to Price_History
-        if history_ws:
-            log_price_history(history_ws, name, live_price, target)
-
-        # Track price change
-        if old_price is not None and old_price != live_price:
-            diff = live_price - old_price
-            changes.append({
-                "name": name,
-                "old_price": old_price,
-                "new_price": live_price,
-                "diff": diff,
-                "target": target,
-            })
+            # Log to Price_History
+            if history_ws:
+                log_price_history(history_ws, name, live_price, target)
 
-        if live_price <= target:
-            # Smart alert: skip if we already notified at this price
-            if last_alerted_str == f"{live_price:.2f}":
-                log.info("   🔕 Already alerted at ₹%.2f, skipping.", live_price)
-            else:
-                alerts.append({
+            # Track price change
+            if old_price is not None and old_price != live_price:
+                diff = live_price - old_price
+                changes.append({
                     "name": name,
-                    "url": url,
-                    "live_price": live_price,
-                    "target_price": target,
-                    "saved": target - live_price,
-                    "row_index": i,  # For writing Last_Alerted
+                    "old_price": old_price,
+                    "new_price": live_price,
+                    "diff": diff,
+                    "target": target,
                 })
-                log.info("   🔥 DEAL! ₹%.0f below target.", target - live_price)
-        else:
-            # Price above target: clear Last_Alerted so future drops re-trigger
-            if last_alerted_str:
-                try:
-                    products_ws.update_cell(i, 5, "")
-                except Exception:
-                    pass
-            log.info("   ⏳ Above target by ₹%.0f.", live_price - target)
+
+            if live_price <= target:
+                # Smart alert: skip if we already notified at this price
+                if last_alerted_str == f"{live_price:.2f}":
+                    log.info("   🔕 Already alerted at ₹%.2f, skipping.", live_price)
+                else:
+                    alerts.append({
+                        "name": name,
+                        "url": url,
+                        "live_price": live_price,
+                        "target_price": target,
+                        "saved": target - live_price,
+                        "row_index": i,  # For writing Last_Alerted
+                    })
+                    log.info("   🔥 DEAL! ₹%.0f below target.", target - live_price)
+            else:
+                # Price above target: clear Last_Alerted so future drops re-trigger
+                if last_alerted_str:
+                    cell_updates.append({"range": f"E{i}", "values": [[""]]})
+                log.info("   ⏳ Above target by ₹%.0f.", live_price - target)
+
+        if cell_updates:
+            try:
+                products_ws.batch_update(cell_updates, value_input_option="USER_ENTERED")
+            except Exception as exc:
+                log.warning("   Could not update sheet cells: %s", exc)
+            else:
+                # First prices over N/A and cleared Last_Alerted cells count too
+                invalidate_product_caches()
+    finally:
+        if history_ws:
+            flush_history(history_ws)
 
     log.info("   📊 Checked %d products, %d changes, %d deals.",
              checked, len(changes), len(alerts))
-    return alerts, changes
+    return alerts, changes, total
 
 
 def phase3_notify(
@@ -1818,6 +2995,7 @@ def phase3_notify(
     # ── Price drop alerts ──
     if alerts:
         lines.append("🔥 <b>Price Drop Alerts!</b>\n")
+        alerted_cells: list[dict] = []
         for i, deal in enumerate(alerts, 1):
             lines.append(
                 f"{i}. <b>{deal['name']}</b>\n"
@@ -1826,13 +3004,18 @@ def phase3_notify(
                 f"   🔗 <a href=\"{deal['url']}\">Buy Now →</a>\n"
             )
             # Write Last_Alerted so we don't re-alert at the same price
-            if products_ws and "row_index" in deal:
-                try:
-                    products_ws.update_cell(
-                        deal["row_index"], 5, f"{deal['live_price']:.2f}"
-                    )
-                except Exception:
-                    pass
+            if "row_index" in deal:
+                alerted_cells.append({
+                    "range": f"E{deal['row_index']}",
+                    "values": [[f"{deal['live_price']:.2f}"]],
+                })
+        if products_ws and alerted_cells:
+            try:
+                products_ws.batch_update(alerted_cells, value_input_option="USER_ENTERED")
+            except Exception:
+                pass
+            else:
+                invalidate_product_caches()  # Last_Alerted values changed
 
     # ── Price movements (even if not deals) ──
     if changes:
@@ -1875,348 +3058,81 @@ def process_single_message(
     chat_id: str,
     products_ws: gspread.Worksheet,
     history_ws: gspread.Worksheet | None = None,
-) -> None:
+    command: str | None = None,
+) -> str | None:
     """
     Process a single incoming Telegram message instantly.
-    Used by the webhook endpoint for real-time responses.
+    Used by the webhook endpoint and by Phase 1 polling.
+    Returns the confirmation message if a product was added.
+    Callers that already parsed the command_token() may pass it in.
     """
     if not text:
-        return
-
-    text_lower = text.strip().lower()
-
-    # ── /news — AI News Summary ──
-    if text_lower.startswith("/news"):
-        args = text[5:].strip()
-        if text_lower.startswith("/news saved"):
-            handle_news_saved(chat_id)
-        elif text_lower.startswith("/news save"):
-            handle_news_save(args[5:].strip(), chat_id)
-        elif text_lower.startswith("/news trending"):
-            handle_news_trending(chat_id)
-        elif text_lower.startswith("/news multi"):
-            handle_news_multi(args[6:].strip(), chat_id)
-        elif text_lower.startswith("/news deep"):
-            handle_news_deep(args[5:].strip(), chat_id)
-        elif text_lower.startswith("/news voice"):
-            handle_news_voice(args[6:].strip(), chat_id)
-        elif text_lower.startswith("/news card"):
-            handle_news_card(args[5:].strip(), chat_id)
-        elif text_lower.startswith("/news schedule"):
-            handle_news_schedule(args[9:].strip(), chat_id)
-        else:
-            handle_news_command(args, chat_id)
-        return
-
-    # ── /start — Welcome message ──
-    if text_lower.startswith("/start"):
-        send_telegram_message(
-            "🎯 <b>Welcome to Price Drop Hunter!</b>\n\n"
-            "I track prices on <b>Amazon</b> and <b>Flipkart</b> "
-            "and alert you when they drop.\n\n"
-            "<b>How to add a product:</b>\n"
-            "Just paste any Amazon/Flipkart URL!\n\n"
-            "• <code>URL</code> — auto-target 15% below current price\n"
-            "• <code>URL 2000</code> — set ₹2,000 as your target\n\n"
-            "Type /help to see all commands.",
-            chat_id,
-        )
-        return
-
-    # ── /help — Show all commands ──
-    if text_lower.startswith("/help"):
-        send_telegram_message(
-            "❓ <b>Available Commands</b>\n\n"
-            "<b>Add products:</b>\n"
-            "• Just paste any Flipkart/Amazon URL\n"
-            "• Add a target price after the URL\n"
-            "• Or use: <code>/add URL PRICE</code>\n\n"
-            "<b>Manage watchlist:</b>\n"
-            "• /list — View all tracked products\n"
-            "• /remove 2 — Remove product #2\n"
-            "• /remove all — Clear entire watchlist\n"
-            "• /edit 2 1500 — Change target for #2\n"
-            "• /pause 2 — Pause tracking for #2\n"
-            "• /resume 2 — Resume tracking for #2\n\n"
-            "<b>Info:</b>\n"
-            "• /history 1 — Price history for #1\n"
-            "• /status — Quick summary\n"
-            "• /news <topic> — AI news (try: tech, sports, detail)\n"
-            "• /news save <topic> / saved — Save & fetch topics\n"
-            "• /news multi / trending / deep — Advanced modes\n"
-            "• /news voice / card / schedule — Media & digest\n"
-            "• /help — This message\n\n"
-            "Prices are checked every hour automatically. 🕐",
-            chat_id,
-        )
-        return
-
-    # ── /status — Quick summary ──
-    if text_lower.startswith("/status"):
-        all_rows = products_ws.get_all_values()
-        count = max(0, len(all_rows) - 1)
-        paused = sum(1 for r in all_rows[1:] if len(r) > 5 and r[5] == "paused")
-        active = count - paused
-        send_telegram_message(
-            f"📊 <b>Status</b>\n\n"
-            f"Products tracked: <b>{count}</b> "
-            f"(🟢 {active} active, ⏸️ {paused} paused)\n"
-            f"Price checks: every 1 hour\n"
-            f"Scraping: Amazon + Flipkart",
-            chat_id,
-        )
-        return
-
-    # ── /list — View watchlist ──
-    if text_lower.startswith("/list"):
-        log.info("📋 /list command received.")
-        all_rows = products_ws.get_all_values()
-        if len(all_rows) <= 1:
-            send_telegram_message(
-                "📋 Your watchlist is empty.\n"
-                "Just paste any Amazon/Flipkart URL to start tracking!",
-                chat_id,
-            )
-        else:
-            lines = ["📋 <b>Your Watchlist</b>\n"]
-            for i, row in enumerate(all_rows[1:], 1):
-                name = row[0] if len(row) > 0 else "?"
-                target = row[2] if len(row) > 2 else "?"
-                current = row[3] if len(row) > 3 else "N/A"
-                status = row[5] if len(row) > 5 else "active"
-                icon = "⏸️" if status == "paused" else "🟢"
-                lines.append(
-                    f"{icon} {i}. <b>{name}</b>\n"
-                    f"   Target: ₹{target} | Last: {current}"
-                )
-            send_telegram_message("\n".join(lines), chat_id)
-        return
-
-    # ── /remove — Remove product(s) ──
-    if text_lower.strip() == "/remove" or text_lower.strip().startswith("/remove@"):
-        all_rows = products_ws.get_all_values()
-        if len(all_rows) <= 1:
-            send_telegram_message("📋 Watchlist is empty — nothing to remove.", chat_id)
-        else:
-            lines = ["🗑️ <b>Which product to remove?</b>\n"]
-            for i, row in enumerate(all_rows[1:], 1):
-                name = row[0] if len(row) > 0 else "?"
-                lines.append(f"{i}. {name}")
-            lines.append("\nReply with:\n• <code>/remove 2</code> — remove #2\n• <code>/remove all</code> — clear all")
-            send_telegram_message("\n".join(lines), chat_id)
-        return
-
-    remove_arg = parse_remove_command(text)
-    if remove_arg is not None:
-        all_rows = products_ws.get_all_values()
-        data_count = len(all_rows) - 1
-
-        if remove_arg.lower() == "all":
-            if data_count <= 0:
-                send_telegram_message("📋 Watchlist is already empty.", chat_id)
-            else:
-                for row_idx in range(data_count + 1, 1, -1):
-                    products_ws.delete_rows(row_idx)
-                send_telegram_message(
-                    f"🗑️ Cleared <b>{data_count}</b> product(s) from your watchlist.",
-                    chat_id,
-                )
-                log.info("   🗑️ Cleared all %d products.", data_count)
-            return
+        return None
 
-        try:
-            idx = int(remove_arg)
-        except ValueError:
-            send_telegram_message(
-                "⚠️ Usage: <code>/remove 2</code> or <code>/remove all</code>",
-                chat_id,
-            )
-            return
+    if command is None:
+        command = command_token(text)
+    handler = COMMAND_HANDLERS.get(command)
+    if handler:
+        return handler(text, chat_id, products_ws, history_ws)
 
-        if idx < 1 or idx > data_count:
-            send_telegram_message(
-                f"⚠️ Invalid number. You have {data_count} product(s). "
-                f"Use /list to see them.",
-                chat_id,
-            )
-        else:
-            removed_name = all_rows[idx][0] if len(all_rows[idx]) > 0 else "?"
-            products_ws.delete_rows(idx + 1)
-            send_telegram_message(
-                f"🗑️ Removed <b>{removed_name}</b> from your watchlist.",
-                chat_id,
-            )
-            log.info("   🗑️ Removed row %d: '%s'", idx, removed_name)
-        return
+    # ── Auto-detect URL (no /add needed) ──
+    return add_from_text(text, chat_id, products_ws)
 
-    # ── /edit — Change target price ──
-    if text_lower.strip() == "/edit" or text_lower.strip().startswith("/edit@"):
-        all_rows = products_ws.get_all_values()
-        if len(all_rows) <= 1:
-            send_telegram_message("📋 Watchlist is empty — nothing to edit.", chat_id)
-        else:
-            lines = ["✏️ <b>Which product to edit?</b>\n"]
-            for i, row in enumerate(all_rows[1:], 1):
-                name = row[0] if len(row) > 0 else "?"
-                target = row[2] if len(row) > 2 else "?"
-                lines.append(f"{i}. {name} (target: ₹{target})")
-            lines.append("\nReply with:\n• <code>/edit 2 1500</code> — set #2 target to ₹1,500")
-            send_telegram_message("\n".join(lines), chat_id)
-        return
 
-    edit_parsed = parse_edit_command(text)
-    if edit_parsed:
-        idx, new_price = edit_parsed
-        all_rows = products_ws.get_all_values()
-        data_count = len(all_rows) - 1
-
-        if idx < 1 or idx > data_count:
-            send_telegram_message(
-                f"⚠️ Invalid number. You have {data_count} product(s). "
-                f"Use /list to see them.",
-                chat_id,
-            )
-        else:
-            name = all_rows[idx][0] if len(all_rows[idx]) > 0 else "?"
-            products_ws.update_cell(idx + 1, 3, str(new_price))
-            send_telegram_message(
-                f"✏️ Updated target for <b>{name}</b> to ₹{new_price:,.0f}",
-                chat_id,
-            )
-            log.info("   ✏️ Updated target for '%s' → ₹%.0f", name, new_price)
-        return
+# ──────────────────────────── Flask App ───────────────────────────
 
-    # ── /history — Show price history ──
-    if text_lower.strip() == "/history" or text_lower.strip().startswith("/history@"):
-        all_rows = products_ws.get_all_values()
-        if len(all_rows) <= 1:
-            send_telegram_message("📋 Watchlist is empty — nothing to show.", chat_id)
-        else:
-            lines = ["📜 <b>Which product's history?</b>\n"]
-            for i, row in enumerate(all_rows[1:], 1):
-                name = row[0] if len(row) > 0 else "?"
-                lines.append(f"{i}. {name}")
-            lines.append("\nReply with:\n• <code>/history 1</code> — show history for #1")
-            send_telegram_message("\n".join(lines), chat_id)
-        return
+app = Flask(__name__)
 
-    history_idx = parse_history_command(text)
-    if history_idx is not None:
-        all_rows = products_ws.get_all_values()
-        data_count = len(all_rows) - 1
-        if history_idx < 1 or history_idx > data_count:
-            send_telegram_message(
-                f"⚠️ Invalid number. You have {data_count} product(s). "
-                f"Use /list to see them.", chat_id,
-            )
-        elif history_ws:
-            product_name = all_rows[history_idx][0]
-            hist_rows = history_ws.get_all_values()
-            matches = [r for r in hist_rows[1:] if r[1] == product_name]
-            if not matches:
-                send_telegram_message(
-                    f"📜 No history yet for <b>{product_name}</b>.\n"
-                    "History is recorded during hourly price checks.",
-                    chat_id,
-                )
-            else:
-                recent = matches[-10:]
-                lines = [f"📜 <b>Price History: {product_name}</b>\n"]
-                for entry in reversed(recent):
-                    date = entry[0] if len(entry) > 0 else "?"
-                    price = entry[2] if len(entry) > 2 else "?"
-                    lines.append(f"  {date} — ₹{price}")
-                send_telegram_message("\n".join(lines), chat_id)
-        else:
-            send_telegram_message("⚠️ Price history is not available.", chat_id)
-        return
+# Register bot commands at import time when served (gunicorn on Render
+# imports this module). Runs in a background thread to avoid blocking worker
+# startup. Script runs (python main.py ...) decide for themselves below.
+if TELEGRAM_TOKEN and __name__ != "__main__":
+    threading.Thread(target=register_bot_commands, daemon=True).start()
 
-    # ── /pause — Pause tracking ──
-    if text_lower.strip() == "/pause" or text_lower.strip().startswith("/pause@"):
-        all_rows = products_ws.get_all_values()
-        if len(all_rows) <= 1:
-            send_telegram_message("📋 Watchlist is empty.", chat_id)
-        else:
-            lines = ["⏸️ <b>Which product to pause?</b>\n"]
-            for i, row in enumerate(all_rows[1:], 1):
-                name = row[0] if len(row) > 0 else "?"
-                status = row[5] if len(row) > 5 else "active"
-                icon = "⏸️" if status == "paused" else "🟢"
-                lines.append(f"{icon} {i}. {name}")
-            lines.append("\nReply with:\n• <code>/pause 1</code> — pause #1")
-            send_telegram_message("\n".join(lines), chat_id)
-        return
 
-    pause_idx = parse_pause_command(text)
-    if pause_idx is not None:
-        all_rows = products_ws.get_all_values()
-        data_count = len(all_rows) - 1
-        if pause_idx < 1 or pause_idx > data_count:
-            send_telegram_message(
-                f"⚠️ Invalid number. You have {data_count} product(s).", chat_id,
-            )
-        else:
-            name = all_rows[pause_idx][0] if len(all_rows[pause_idx]) > 0 else "?"
-            products_ws.update_cell(pause_idx + 1, 6, "paused")
-            send_telegram_message(
-                f"⏸️ Paused tracking for <b>{name}</b>.\n"
-                f"Use <code>/resume {pause_idx}</code> to resume.",
-                chat_id,
-            )
-        return
+# News fetches (RSS + Gemini) only read the sheet and run here in parallel
+_BACKGROUND = ThreadPoolExecutor(max_workers=4, thread_name_prefix="webhook-bg")
 
-    # ── /resume — Resume tracking ──
-    if text_lower.strip() == "/resume" or text_lower.strip().startswith("/resume@"):
-        all_rows = products_ws.get_all_values()
-        if len(all_rows) <= 1:
-            send_telegram_message("📋 Watchlist is empty.", chat_id)
-        else:
-            lines = ["▶️ <b>Which product to resume?</b>\n"]
-            for i, row in enumerate(all_rows[1:], 1):
-                name = row[0] if len(row) > 0 else "?"
-                status = row[5] if len(row) > 5 else "active"
-                icon = "⏸️" if status == "paused" else "🟢"
-                lines.append(f"{icon} {i}. {name}")
-            lines.append("\nReply with:\n• <code>/resume 1</code> — resume #1")
-            send_telegram_message("\n".join(lines), chat_id)
-        return
+# Everything that can change a sheet (/add, pasted URLs, /remove, /edit,
+# /pause, /news save, ...) goes through one worker, so commands apply in the
+# order they were sent without the request waiting on Sheets. Started lazily
+# so it lives in the serving (post-fork) process.
+WEBHOOK_QUEUE_SIZE = 128
+_webhook_queue: queue.Queue = queue.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+_webhook_worker: threading.Thread | None = None
+_webhook_worker_lock = threading.Lock()
 
-    resume_idx = parse_resume_command(text)
-    if resume_idx is not None:
-        all_rows = products_ws.get_all_values()
-        data_count = len(all_rows) - 1
-        if resume_idx < 1 or resume_idx > data_count:
-            send_telegram_message(
-                f"⚠️ Invalid number. You have {data_count} product(s).", chat_id,
-            )
-        else:
-            name = all_rows[resume_idx][0] if len(all_rows[resume_idx]) > 0 else "?"
-            products_ws.update_cell(resume_idx + 1, 6, "active")
-            send_telegram_message(
-                f"▶️ Resumed tracking for <b>{name}</b>.",
-                chat_id,
-            )
-        return
 
-    # ── Auto-detect URL (no /add needed) ──
-    url_detected = detect_url_in_text(text)
-    if url_detected:
-        url, target_price = url_detected
-        log.info("📥 URL detected: %s (target: %s)", url, target_price or "auto")
-        msg = handle_add_product(products_ws, url, target_price)
-        send_telegram_message(msg, chat_id)
-        return
+def _webhook_worker_loop() -> None:
+    while True:
+        message = _webhook_queue.get()
+        with products_write_lock:
+            handle_webhook_message(*message)
 
 
-# ──────────────────────────── Flask App ───────────────────────────
+def enqueue_webhook_message(text: str, chat_id: str, command: str) -> None:
+    """Queue a message for the in-order worker; drop it if the queue is full."""
+    global _webhook_worker
+    with _webhook_worker_lock:
+        if _webhook_worker is None or not _webhook_worker.is_alive():
+            _webhook_worker = threading.Thread(target=_webhook_worker_loop,
+                                               name="webhook-queue", daemon=True)
+            _webhook_worker.start()
+    try:
+        _webhook_queue.put_nowait((text, chat_id, command))
+    except queue.Full:
+        log.warning("⚠️ Webhook queue full, dropping: %s", command)
 
-app = Flask(__name__)
 
-# Register bot commands at import time (for gunicorn on Render)
-# Run in background thread to avoid blocking worker startup
-import threading
-if TELEGRAM_TOKEN:
-    threading.Thread(target=register_bot_commands, daemon=True).start()
+def handle_webhook_message(text: str, chat_id: str, command: str | None = None) -> None:
+    """Open the sheet and process one webhook message, reporting failures."""
+    try:
+        products_ws, history_ws = get_cached_sheets()
+        process_single_message(text, chat_id, products_ws, history_ws, command)
+    except Exception as exc:
+        log.error("Webhook processing error: %s", exc)
+        invalidate_sheet_handles()
+        send_telegram_message("❌ Something went wrong. Please try again.", chat_id)
 
 
 @app.route("/health", methods=["GET"])
@@ -2237,24 +3153,34 @@ def webhook():
             log.warning("⚠️ Webhook: invalid secret token.")
             return jsonify({"error": "unauthorized"}), 403
 
-    data = flask_request.get_json(silent=True) or {}
-    message = data.get("message", {})
-    text = message.get("text", "")
-    chat_id = str(message.get("chat", {}).get("id", CHAT_ID))
+    try:
+        data = orjson.loads(flask_request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        data = None
+    message = (data.get("message") if isinstance(data, dict) else None) or {}
+    text = message.get("text") or ""
+    chat_id = str((message.get("chat") or {}).get("id") or CHAT_ID)
 
     if not text:
         return jsonify({"ok": True})
 
-    log.info("📨 Webhook message from %s: %s", chat_id, text[:80])
+    # Chatter that is neither a known command nor a product link never
+    # needs the sheet; acknowledge it before any Sheets work
+    command = command_token(text)
+    is_command = command in COMMAND_HANDLERS
+    if not is_command and detect_url_in_text(text) is None:
+        return jsonify({"ok": True})
 
-    try:
-        sheet = connect_to_sheet()
-        products_ws = get_products_worksheet(sheet)
-        history_ws = get_history_worksheet(sheet)
-        process_single_message(text, chat_id, products_ws, history_ws)
-    except Exception as exc:
-        log.error("Webhook processing error: %s", exc)
-        send_telegram_message("❌ Something went wrong. Please try again.", chat_id)
+    if log.isEnabledFor(logging.INFO):
+        log.info("📨 Webhook message from %s: %s", chat_id, text[:80])
+
+    # Acknowledge at once; Telegram retries updates it isn't answered for.
+    # Read-only news fetches run in parallel; the rest keep their order.
+    if (command == "/news" and split_news_command(text)[1]
+            not in NEWS_ORDERED_SUBCOMMANDS):
+        _BACKGROUND.submit(handle_webhook_message, text, chat_id, command)
+    else:
+        enqueue_webhook_message(text, chat_id, command)
 
     return jsonify({"ok": True})
 
@@ -2275,13 +3201,14 @@ def check_prices_endpoint():
 
     try:
         validate_config()
-        sheet = connect_to_sheet()
-        products_ws = get_products_worksheet(sheet)
-        history_ws = get_history_worksheet(sheet)
+        products_ws, history_ws = get_cached_sheets()
 
-        total = max(0, len(products_ws.get_all_values()) - 1)
-        alerts, changes = phase2_check_prices(products_ws, history_ws)
-        phase3_notify([], alerts, changes, total, products_ws)
+        # Row numbers read in phase 2 are written back in phases 2 and 3,
+        # so queued webhook commands wait until the check is done
+        with products_write_lock:
+            alerts, changes, total = phase2_check_prices(products_ws, history_ws)
+            phase3_notify([], alerts, changes, total, products_ws)
+        schedule_price_prefetch(products_ws)
 
         return jsonify({
             "ok": True,
@@ -2291,6 +3218,7 @@ def check_prices_endpoint():
         })
     except Exception as exc:
         log.error("Price check error: %s", exc)
+        invalidate_sheet_handles()
         return jsonify({"error": str(exc)}), 500
 
 
@@ -2299,21 +3227,30 @@ def main() -> None:
     """Classic standalone mode: process commands + check prices + notify."""
     validate_config()
 
-    # Register bot commands (creates the clickable menu in Telegram)
-    register_bot_commands()
+    # With a webhook registered the server answers commands in real time and
+    # has already set up the menu; getUpdates would only return 409.
+    webhook_active = telegram_webhook_active()
+    if not webhook_active:
+        # Register bot commands (creates the clickable menu in Telegram)
+        register_bot_commands()
 
     # Connect to Google Sheets
     sheet = connect_to_sheet()
     products_ws = get_products_worksheet(sheet)
     settings_ws = get_settings_worksheet(sheet)
     history_ws = get_history_worksheet(sheet)
+    last_update_id = read_startup_values(sheet, settings_ws, products_ws)
 
     # Phase 1 — Process new Telegram commands
-    added_messages = phase1_process_commands(settings_ws, products_ws, history_ws)
+    if webhook_active:
+        log.info("Telegram webhook is active; skipping Phase 1.")
+        added_messages = []
+    else:
+        added_messages = phase1_process_commands(
+            settings_ws, products_ws, history_ws, last_update_id)
 
     # Phase 2 — Check all tracked prices
-    total = max(0, len(products_ws.get_all_values()) - 1)
-    alerts, changes = phase2_check_prices(products_ws, history_ws)
+    alerts, changes, total = phase2_check_prices(products_ws, history_ws)
 
     # Phase 3 — Send consolidated notification
     phase3_notify(added_messages, alerts, changes, total, products_ws)
@@ -2332,7 +3269,8 @@ def setup_telegram_webhook(render_url: str) -> None:
     if WEBHOOK_SECRET:
         payload["secret_token"] = WEBHOOK_SECRET
 
-    resp = requests.post(api_url, json=payload, timeout=10)
+    resp = _TG_SESSION.post(api_url, data=orjson.dumps(payload),
+                            headers=JSON_HEADERS, timeout=TG_TIMEOUT)
     if resp.ok:
         log.info("✅ Telegram webhook set to: %s", webhook_url)
     else: